@@ -0,0 +1,274 @@
+"""
+Benchmark the core operations taught by the tutorial lessons.
+
+Every benchmark below reproduces the hot path of one lesson (filters, meshing,
+streamlines and volume rendering) on the same datasets, without the plotting
+that surrounds it in the lesson. The benchmarks run off screen, each one is
+timed over repeated runs and the samples are appended to a history file
+together with the installed ``pyvista`` and ``vtk`` versions.
+
+When the versions differ from the most recent run in the history, for example
+after bumping the pins in ``pyproject.toml``, every benchmark is compared with
+that run using a one-sided Mann-Whitney U test and slowdowns that are both
+statistically significant and larger than ``--threshold`` are flagged.
+
+Usage::
+
+    python benchmarks/tutorial_benchmarks.py --repeat 7
+    python benchmarks/tutorial_benchmarks.py threshold contour --compare-last
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import importlib.metadata
+import json
+import platform
+import statistics
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+import pyvista as pv
+from pyvista import examples
+from scipy.stats import mannwhitneyu
+from vtkmodules.vtkImagingHybrid import vtkGaussianSplatter
+
+pv.OFF_SCREEN = True
+
+BENCHMARKS = {}
+
+
+def benchmark(lesson):
+    """
+    Register a benchmark for ``lesson``.
+
+    The decorated function prepares the inputs and returns the callable that
+    is timed, so that loading the datasets is not part of the measurement.
+    """
+
+    def decorator(func):
+        BENCHMARKS[func.__name__] = (lesson, func)
+        return func
+
+    return decorator
+
+
+@benchmark("04_filters/a_lesson_filters.py")
+def threshold():
+    dataset = examples.load_uniform()
+    dataset.set_active_scalars("Spatial Point Data")
+    return lambda: dataset.threshold([100, 500])
+
+
+@benchmark("04_filters/a_lesson_filters.py")
+def contour():
+    dataset = examples.load_uniform()
+    return dataset.contour
+
+
+@benchmark("04_filters/a_lesson_filters.py")
+def glyph():
+    dataset = examples.load_uniform()
+    geom = pv.Sphere()
+    return lambda: dataset.glyph(factor=1e-3, geom=geom, orient=False)
+
+
+@benchmark("04_filters/a_lesson_filters.py")
+def filter_pipeline():
+    dataset = examples.load_uniform()
+    return lambda: dataset.threshold().elevation().clip(normal="z").slice_orthogonal()
+
+
+@benchmark("04_filters/solutions/b_clipping.py")
+def clip_box():
+    dataset = examples.download_office()
+    return lambda: dataset.clip_box([2, 4.5, 2, 4.5, 1, 3])
+
+
+@benchmark("04_filters/solutions/b_clipping.py")
+def clip_box_rotated():
+    mesh = examples.load_airplane()
+    roi = pv.Cube(center=(0.9e3, 0.2e3, mesh.center[2]), x_length=500, y_length=500, z_length=500)
+    roi.rotate_z(33, inplace=True)
+    return lambda: mesh.clip_box(roi, invert=False)
+
+
+@benchmark("02_mesh/solutions/d_create-tri-surface.py")
+def delaunay_2d():
+    rng = np.random.default_rng(0)
+    x = np.arange(10, dtype=float)
+    xx, yy, zz = np.meshgrid(x, x, [0])
+    points = np.column_stack((xx.ravel(order="F"), yy.ravel(order="F"), zz.ravel(order="F")))
+    points[:, :2] += rng.random((len(points), 2)) * 0.3
+    cloud = pv.PolyData(points)
+    return lambda: cloud.delaunay_2d(alpha=1.0)
+
+
+@benchmark("04_filters/solutions/c_compute-normals.py")
+def compute_normals():
+    mesh = examples.download_topo_global()
+    return mesh.compute_normals
+
+
+@benchmark("04_filters/solutions/c_compute-normals.py")
+def compute_cell_normals():
+    mesh = examples.download_nefertiti()
+    return lambda: mesh.compute_normals(cell_normals=True, point_normals=False)
+
+
+@benchmark("06_vtk/a_2_pyvista_vtk.py")
+def gaussian_splatter():
+    mesh = examples.download_bunny_coarse()
+
+    def splat():
+        splatter = vtkGaussianSplatter()
+        splatter.SetInputData(mesh)
+        splatter.SetSampleDimensions(200, 200, 200)
+        splatter.SetRadius(0.02)
+        splatter.SetExponentFactor(-10)
+        splatter.SetEccentricity(2)
+        splatter.Update()
+        return pv.wrap(splatter.GetOutput()).contour([0.95 * splatter.GetRadius()])
+
+    return splat
+
+
+@benchmark("08_widgets/c_line-widget.py")
+def streamlines():
+    mesh = examples.download_kitchen()
+    xmin, xmax, ymin, ymax, zmin, zmax = mesh.bounds
+    pointa = (xmin + 0.1 * (xmax - xmin), (ymin + ymax) / 2, (zmin + zmax) / 2)
+    pointb = (xmin + 0.1 * (xmax - xmin), (ymin + ymax) / 2, zmin + 0.9 * (zmax - zmin))
+    return lambda: mesh.streamlines(
+        n_points=10,
+        max_steps=100,
+        pointa=pointa,
+        pointb=pointb,
+        integration_direction="forward",
+    )
+
+
+@benchmark("02_mesh/solutions/c_create-uniform-grid.py")
+def volume_rendering():
+    vol = examples.download_knee_full()
+
+    def render():
+        pl = pv.Plotter(off_screen=True)
+        pl.add_volume(vol, cmap="bone", opacity="sigmoid")
+        pl.screenshot()
+        pl.close()
+
+    return render
+
+
+def versions():
+    """Return the versions that the benchmark results depend on."""
+    return {
+        "python": platform.python_version(),
+        "pyvista": pv.__version__,
+        "vtk": importlib.metadata.version("vtk"),
+        "numpy": np.__version__,
+    }
+
+
+def run(names, repeat=7):
+    """Time the benchmarks and return the per-call samples in seconds."""
+    results = {}
+    for name in names:
+        func = BENCHMARKS[name][1]()
+        # Warm up caches and lazy imports before measuring
+        func()
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        results[name] = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+        print(f"{name:<25} {statistics.median(results[name]) * 1e3:10.3f} ms")
+    return results
+
+
+def read_history(path):
+    path = Path(path)
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line]
+
+
+def append_history(path, record) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def compare(baseline, results, alpha=0.01, threshold=0.05):
+    """
+    Return the benchmarks significantly slower than in ``baseline``.
+
+    Each entry is ``(name, baseline median, current median, p-value)``.
+    """
+    regressions = []
+    for name, samples in results.items():
+        previous = baseline["results"].get(name)
+        if not previous:
+            continue
+        _, pvalue = mannwhitneyu(samples, previous, alternative="greater")
+        before, after = statistics.median(previous), statistics.median(samples)
+        if pvalue < alpha and after > before * (1 + threshold):
+            regressions.append((name, before, after, pvalue))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("names", nargs="*", help="benchmarks to run, all by default")
+    parser.add_argument("--repeat", type=int, default=7, help="timed runs per benchmark")
+    parser.add_argument("--history", default=".benchmarks/history.jsonl", help="history file")
+    parser.add_argument(
+        "--compare-last",
+        action="store_true",
+        help="compare with the last run even when the versions did not change",
+    )
+    parser.add_argument("--alpha", type=float, default=0.01, help="significance level")
+    parser.add_argument(
+        "--threshold", type=float, default=0.05, help="smallest relative slowdown to report"
+    )
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (lesson, _) in BENCHMARKS.items():
+            print(f"{name:<25} {lesson}")
+        return 0
+
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    history = read_history(args.history)
+    record = {
+        "date": dt.datetime.now(tz=dt.timezone.utc).isoformat(),
+        "versions": versions(),
+        "results": run(args.names or list(BENCHMARKS), repeat=args.repeat),
+    }
+    append_history(args.history, record)
+
+    if not history:
+        return 0
+    baseline = history[-1]
+    if baseline["versions"] == record["versions"] and not args.compare_last:
+        return 0
+    regressions = compare(baseline, record["results"], alpha=args.alpha, threshold=args.threshold)
+    for name, before, after, pvalue in regressions:
+        print(
+            f"REGRESSION {name}: {before * 1e3:.3f} ms -> {after * 1e3:.3f} ms "
+            f"({after / before - 1:+.1%}, p={pvalue:.2g}) "
+            f"since {baseline['versions']} -> {record['versions']}"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+Build profiles trading figure quality for gallery execution time.
+
+The ``full`` profile renders the gallery as published. The ``preview`` profile
+is meant for drafts, when authors only want to check the layout of a page: it
+renders at half the resolution without anti-aliasing and writes a quarter of
+the frames of every GIF and movie. Select it with::
+
+    PYVISTA_TUTORIAL_BUILD_PROFILE=preview make html
+
+The examples do not need to know about the profiles. :func:`apply` wraps the
+PyVista entry points they already use: the window size of every
+:class:`pyvista.Plotter`, including explicit ones such as the
+``window_size=np.array([1024, 768]) * 3`` of the geological map, the
+``n_points`` of :meth:`~pyvista.Plotter.generate_orbital_path` and the frames
+written by :meth:`~pyvista.Plotter.write_frame` in loops like the ``nframe``
+loop of the GIF lesson.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+
+import pyvista
+
+
+class BuildProfile:
+    """Settings of a build profile."""
+
+    def __init__(
+        self,
+        name,
+        scale=1.0,
+        anti_aliasing=True,  # noqa: FBT002
+        frame_fraction=1.0,
+    ) -> None:
+        self.name = name
+        # Factor applied to the window size of every plotter
+        self.scale = scale
+        self.anti_aliasing = anti_aliasing
+        # Fraction of the animation frames that are rendered and written
+        self.frame_fraction = frame_fraction
+
+    @property
+    def frame_step(self):
+        return max(round(1 / self.frame_fraction), 1)
+
+    def window_size(self, window_size):
+        return [max(math.ceil(size * self.scale), 1) for size in window_size]
+
+    def n_points(self, n_points):
+        return max(math.ceil(n_points * self.frame_fraction), 2)
+
+    def __repr__(self) -> str:
+        return f"BuildProfile({self.name!r})"
+
+
+PROFILES = {
+    "full": BuildProfile("full"),
+    "preview": BuildProfile("preview", scale=0.5, anti_aliasing=False, frame_fraction=0.25),
+}
+
+_applied = set()
+
+
+def get_profile(name):
+    """Return the profile called ``name``."""
+    try:
+        return PROFILES[name]
+    except KeyError:
+        msg = f"Unknown build profile {name!r}, expected one of {', '.join(PROFILES)}"
+        raise ValueError(msg) from None
+
+
+def apply(profile) -> None:
+    """Make every plotter of the current process render with ``profile``."""
+    if profile.name == "full" or profile.name in _applied:
+        return
+    plotter = pyvista.Plotter
+    init = plotter.__init__
+    generate_orbital_path = plotter.generate_orbital_path
+    orbit_on_path = plotter.orbit_on_path
+    write_frame = plotter.write_frame
+
+    @functools.wraps(init)
+    def __init__(self, *args, window_size=None, **kwargs):  # noqa: N807
+        if window_size is None:
+            window_size = pyvista.global_theme.window_size
+        init(self, *args, window_size=profile.window_size(window_size), **kwargs)
+        if not profile.anti_aliasing:
+            self.disable_anti_aliasing()
+
+    @functools.wraps(generate_orbital_path)
+    def generate_orbital_path_(self, *args, n_points=20, **kwargs):
+        return generate_orbital_path(self, *args, n_points=profile.n_points(n_points), **kwargs)
+
+    @functools.wraps(orbit_on_path)
+    def orbit_on_path_(self, *args, **kwargs):
+        # The path already has fewer points, write a frame for each of them
+        self._frame_step = 1
+        try:
+            return orbit_on_path(self, *args, **kwargs)
+        finally:
+            del self._frame_step
+
+    @functools.wraps(write_frame)
+    def write_frame_(self):
+        step = getattr(self, "_frame_step", profile.frame_step)
+        self._frames_seen = getattr(self, "_frames_seen", 0) + 1
+        if (self._frames_seen - 1) % step:
+            # Skip the render and the encoding of this frame
+            return None
+        return write_frame(self)
+
+    plotter.__init__ = __init__
+    plotter.generate_orbital_path = generate_orbital_path_
+    plotter.orbit_on_path = orbit_on_path_
+    plotter.write_frame = write_frame_
+    _applied.add(profile.name)
@@ -10,7 +10,10 @@ from atsphinx.mini18n import get_template_dir
 faulthandler.enable()
 
 sys.path.insert(0, str(Path(__file__).absolute().parent))
+import build_profile  # noqa: E402
+import data_mirror  # noqa: E402
 import make_external_gallery  # noqa: E402
+from gallery_profile import ExampleProfiler  # noqa: E402
 
 make_external_gallery.make_example_gallery()
 
@@ -19,25 +22,45 @@ import pyvista  # noqa: E402
 from pyvista.plotting.utilities.sphinx_gallery import DynamicScraper  # noqa: E402
 
 # Manage errors
-pyvista.set_error_output_file("errors.txt")
-# Ensure that offscreen rendering is used for docs generation
-pyvista.OFF_SCREEN = True  # Not necessary - simply an insurance policy
-# Preferred plotting style for documentation
-pyvista.set_plot_theme("document")
-pyvista.global_theme.window_size = [1024, 768]
-pyvista.global_theme.font.size = 22
-pyvista.global_theme.font.label_size = 22
-pyvista.global_theme.font.title_size = 22
-pyvista.global_theme.return_cpos = False
-pyvista.set_jupyter_backend(None)
+ERRORS_FILE = os.path.abspath("errors.txt")  # noqa: PTH100
 # Save figures in specified directory
-pyvista.FIGURE_PATH = os.path.join(os.path.abspath("./images/"), "auto-generated/")  # noqa: PTH100, PTH118
-if not os.path.exists(pyvista.FIGURE_PATH):  # noqa: PTH110
-    os.makedirs(pyvista.FIGURE_PATH)  # noqa: PTH103
-
-# necessary when building the sphinx gallery
-pyvista.BUILDING_GALLERY = True
-os.environ["PYVISTA_BUILDING_GALLERY"] = "true"
+FIGURE_PATH = os.path.join(os.path.abspath("./images/"), "auto-generated/")  # noqa: PTH100, PTH118
+if not os.path.exists(FIGURE_PATH):  # noqa: PTH110
+    os.makedirs(FIGURE_PATH)  # noqa: PTH103
+# Serve all dataset and asset downloads from a local mirror (see data_mirror.py)
+DATA_MIRROR = os.environ.get("PYVISTA_TUTORIAL_MIRROR")
+# Trade figure quality for build time in drafts (see build_profile.py)
+BUILD_PROFILE = build_profile.get_profile(os.environ.get("PYVISTA_TUTORIAL_BUILD_PROFILE", "full"))
+
+
+def configure_pyvista() -> None:
+    """
+    Apply the documentation settings to the pyvista module.
+
+    This runs once when Sphinx loads this file and again in every gallery
+    worker process, so parallel builds render exactly like serial ones.
+    """
+    pyvista.set_error_output_file(ERRORS_FILE)
+    # Ensure that offscreen rendering is used for docs generation
+    pyvista.OFF_SCREEN = True  # Not necessary - simply an insurance policy
+    # Preferred plotting style for documentation
+    pyvista.set_plot_theme("document")
+    pyvista.global_theme.window_size = [1024, 768]
+    pyvista.global_theme.font.size = 22
+    pyvista.global_theme.font.label_size = 22
+    pyvista.global_theme.font.title_size = 22
+    pyvista.global_theme.return_cpos = False
+    pyvista.FIGURE_PATH = FIGURE_PATH
+    # necessary when building the sphinx gallery
+    pyvista.BUILDING_GALLERY = True
+    os.environ["PYVISTA_BUILDING_GALLERY"] = "true"
+    if DATA_MIRROR:
+        data_mirror.install(DATA_MIRROR)
+    build_profile.apply(BUILD_PROFILE)
+
+
+configure_pyvista()
+pyvista.set_jupyter_backend(None)
 
 
 # -- Project information -----------------------------------------------------
@@ -65,6 +88,9 @@ extensions = [
     "sphinx_gallery.gen_gallery",
     "sphinxcontrib.asciinema",
     "vtk_xref",
+    "gallery_cache",
+    "gallery_profile",
+    "gallery_images",
 ]
 
 intersphinx_mapping = {
@@ -182,6 +208,9 @@ class ResetPyVista:
 
         If default documentation settings are modified in any example, reset here.
         """
+        if pyvista.FIGURE_PATH != FIGURE_PATH:
+            # First example executed in a fresh parallel gallery worker process
+            configure_pyvista()
         pyvista._wrappers["vtkPolyData"] = pyvista.PolyData  # noqa: SLF001
         pyvista.set_plot_theme("document")
         pyvista.set_jupyter_backend("static")
@@ -206,6 +235,21 @@ tutorial_dirs = [
     "../../tutorial/09_trame/",
 ]
 
+# Number of worker processes used to execute the gallery examples. Set
+# ``PYVISTA_TUTORIAL_GALLERY_JOBS=auto`` (or ``make html-parallel``) to use one
+# worker per CPU, or an integer for a fixed pool size. Defaults to a serial build.
+gallery_jobs = os.environ.get("PYVISTA_TUTORIAL_GALLERY_JOBS", "1")
+gallery_jobs = os.cpu_count() if gallery_jobs == "auto" else int(gallery_jobs)
+
+# Time, CPU, peak memory, frames and downloads of every executed example are
+# reported in this directory at the end of the build. Set
+# ``PYVISTA_TUTORIAL_PROFILE=""`` to disable.
+gallery_profile_dir = os.environ.get("PYVISTA_TUTORIAL_PROFILE", "build/gallery-profile")
+gallery_profile_dir = gallery_profile_dir and str(Path(gallery_profile_dir).absolute())
+reset_modules = (ResetPyVista(),)
+if gallery_profile_dir:
+    reset_modules += (ExampleProfiler(gallery_profile_dir),)
+
 sphinx_gallery_conf = {
     # convert rst to md for ipynb
     "pypandoc": True,
@@ -234,9 +278,23 @@ sphinx_gallery_conf = {
         "dependencies": ["../../Dockerfile", "../../start"],
         "use_jupyter_lab": True,
     },
-    "reset_modules": (ResetPyVista(),),
+    "reset_modules": reset_modules,
+    # ExampleProfiler measures each example between these two calls
+    "reset_modules_order": "both",
+    # run each example in a worker process of a joblib pool when requested
+    "parallel": gallery_jobs if gallery_jobs > 1 else False,
 }
 
+# Executed examples are cached here, keyed on their source and a fingerprint of
+# the Python environment, and restored instead of being executed again when
+# nothing changed. Set ``PYVISTA_TUTORIAL_GALLERY_CACHE=""`` to disable.
+cache_home = Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser()
+gallery_cache_dir = os.environ.get(
+    "PYVISTA_TUTORIAL_GALLERY_CACHE", str(cache_home / "pyvista-tutorial" / "gallery")
+)
+# Outputs of different build profiles are cached and kept apart
+gallery_cache_tag = BUILD_PROFILE.name
+
 # atsphinx.mini18n options ---------------------------------------------------------
 html_sidebars = {
     "**": [
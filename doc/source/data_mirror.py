@@ -0,0 +1,193 @@
+"""
+A local HTTP mirror for the datasets and remote assets used by the tutorial.
+
+The examples download their data from GitHub through ``pyvista.examples`` and,
+in a few places, fetch remote files with ``requests``. On air-gapped or slow
+runners, start this server next to the build::
+
+    python doc/source/data_mirror.py --root /srv/tutorial-mirror --port 8765
+
+and point the build at it with ``PYVISTA_TUTORIAL_MIRROR=http://localhost:8765``.
+Every ``https://<host>/<path>`` request of the build is then redirected to
+``<mirror>/<host>/<path>`` and served from ``<root>/<host>/<path>``, with
+support for keep-alive connections and ``Range`` requests.
+
+Unless ``--offline`` is given, missing files are fetched once from the
+original location and stored in the mirror, so running a single build on a
+connected machine populates a mirror that can then be copied to offline hosts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import email.utils
+import http.server
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import urllib.parse
+import urllib.request
+from pathlib import Path
+from typing import ClassVar
+
+BYTE_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+CHUNK_SIZE = 64 * 1024
+
+_installed = set()
+
+
+def mirror_url(url, mirror):
+    """Return the address of ``url`` on the mirror."""
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https") or url.startswith(mirror):
+        return url
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{mirror.rstrip('/')}/{parts.netloc}{parts.path}{query}"
+
+
+def install(mirror) -> None:
+    """
+    Redirect the downloads of the current process to ``mirror``.
+
+    This covers the ``pyvista.examples`` fetcher and every ``requests`` call.
+    Requests to the mirror share one pooled session so that connections are
+    kept alive between downloads.
+    """
+    if mirror in _installed:
+        return
+    # Not needed to serve the mirror
+    import requests  # noqa: PLC0415
+    from pyvista.examples import downloads  # noqa: PLC0415
+
+    downloads.FETCHER.base_url = mirror_url(downloads.FETCHER.base_url, mirror)
+
+    session = requests.Session()
+    session.mount(mirror, requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32))
+    original_request = requests.api.request
+
+    def request(method, url, **kwargs):
+        url = mirror_url(url, mirror)
+        if url.startswith(mirror):
+            return session.request(method=method, url=url, **kwargs)
+        return original_request(method, url, **kwargs)
+
+    # ``requests.get`` and friends, also used by pooch, all go through this
+    requests.api.request = request
+    _installed.add(mirror)
+
+
+class MirrorRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Serve mirrored files with keep-alive and single ``Range`` support."""
+
+    protocol_version = "HTTP/1.1"
+    offline = False
+    _locks: ClassVar[dict] = {}
+    _locks_guard = threading.Lock()
+
+    def list_directory(self, path):
+        self.send_error(404, "File not found")
+
+    def fetch_upstream(self, path) -> bool:
+        """Download the requested file from its original location."""
+        if self.offline:
+            return False
+        with self._locks_guard:
+            lock = self._locks.setdefault(path, threading.Lock())
+        with lock:
+            if path.is_file():
+                # Fetched by a concurrent request
+                return True
+            url = f"https://{self.path.lstrip('/')}"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp:
+                try:
+                    with urllib.request.urlopen(url) as response:
+                        shutil.copyfileobj(response, tmp, CHUNK_SIZE)
+                except OSError as err:
+                    self.log_error("could not fetch %s: %s", url, err)
+                    Path(tmp.name).unlink()
+                    return False
+            Path(tmp.name).replace(path)
+            self.log_message("mirrored %s", url)
+            return True
+
+    def send_head(self):
+        path = Path(self.translate_path(self.path))
+        if path.is_dir() or (not path.is_file() and not self.fetch_upstream(path)):
+            self.send_error(404, "File not found")
+            return None
+
+        size = path.stat().st_size
+        start, end = 0, size - 1
+        match = BYTE_RANGE.match(self.headers.get("Range", "").strip())
+        partial = bool(match and any(match.groups()))
+        if partial:
+            first, last = match.groups()
+            if not first:
+                # Suffix range: the last ``last`` bytes
+                start = max(size - int(last), 0)
+            else:
+                start = int(first)
+                end = min(int(last), end) if last else end
+            if start > end:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return None
+
+        f = path.open("rb")
+        f.seek(start)
+        self._remaining = end - start + 1
+        self.send_response(206 if partial else 200)
+        self.send_header("Content-Type", self.guess_type(str(path)))
+        self.send_header("Content-Length", str(self._remaining))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Last-Modified", email.utils.formatdate(path.stat().st_mtime, usegmt=True))
+        if partial:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+        return f
+
+    def copyfile(self, source, outputfile) -> None:
+        while self._remaining > 0:
+            chunk = source.read(min(CHUNK_SIZE, self._remaining))
+            if not chunk:
+                break
+            outputfile.write(chunk)
+            self._remaining -= len(chunk)
+
+
+def serve(root, bind="127.0.0.1", port=8765, offline=False) -> None:  # noqa: FBT002
+    """Serve the mirror stored in ``root`` until interrupted."""
+    root = Path(root).absolute()
+    root.mkdir(parents=True, exist_ok=True)
+    handler = type("Handler", (MirrorRequestHandler,), {"offline": offline, "_locks": {}})
+
+    def factory(*args, **kwargs):
+        return handler(*args, directory=str(root), **kwargs)
+
+    with http.server.ThreadingHTTPServer((bind, port), factory) as httpd:
+        host, port = httpd.server_address[:2]
+        sys.stderr.write(f"Serving {root} at http://{host}:{port}/\n")
+        with contextlib.suppress(KeyboardInterrupt):
+            httpd.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--root", required=True, help="directory holding the mirrored files")
+    parser.add_argument("--bind", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on")
+    parser.add_argument(
+        "--offline", action="store_true", help="never fetch missing files from upstream"
+    )
+    args = parser.parse_args(argv)
+    serve(args.root, bind=args.bind, port=args.port, offline=args.offline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+A persistent cache of executed sphinx-gallery examples.
+
+Executing the whole tutorial gallery takes a long time while most builds only
+touch one or two scripts. After a successful build, the outputs of every
+example (the generated ``.rst`` page, the notebook, the scraped images and the
+``DynamicScraper`` scenes) are stored under a key made of the script source and
+a fingerprint of the Python environment. Before sphinx-gallery runs, matching
+entries are copied back into the gallery so that sphinx-gallery considers those
+examples up to date and does not execute them again.
+
+The key does not depend on the documentation language, so the ``html`` build
+and every language of the ``mini18n-html`` build reuse one execution of the
+gallery, and only the translated prose differs between them.
+
+Examples also depend on the data files stored next to them, such as
+``ironProt.vtk`` or ``scipy.vtk``. Those are part of the key, and the gallery
+directory of every section records the fingerprint of its data files. When
+they change, the examples of that section only are marked as out of date so
+that sphinx-gallery executes them again, while every other section is reused.
+The same applies to ``gallery_cache_tag``, which names the build profile that
+the examples were rendered with.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib.metadata
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from sphinx.util import logging
+
+logger = logging.getLogger(__name__)
+
+# Fingerprint of the data files of a section, stored in its gallery directory
+DATA_STAMP = ".data-fingerprint"
+
+# Suffixes of the data files of the examples, used outside of a git checkout
+DATA_SUFFIXES = frozenset(
+    {".csv", ".npy", ".npz", ".obj", ".ply", ".stl", ".vti", ".vtk", ".vtp", ".vtu"}
+)
+
+
+@functools.cache
+def environment_fingerprint(confdir):
+    """Return a hash of the Python version, installed packages and ``conf.py``."""
+    digest = hashlib.sha256(sys.version.encode())
+    packages = sorted(
+        f"{dist.metadata['Name']}=={dist.version}" for dist in importlib.metadata.distributions()
+    )
+    digest.update("\n".join(packages).encode())
+    digest.update((Path(confdir) / "conf.py").read_bytes())
+    return digest.hexdigest()
+
+
+def data_files(directory):
+    """
+    Return the data files stored next to the examples of ``directory``.
+
+    The examples run in their own directory and write their GIFs and movies
+    there, so only the files tracked by git are data. Outside of a git
+    checkout, the files with a ``DATA_SUFFIXES`` suffix are.
+    """
+    directory = Path(directory)
+    try:
+        tracked = subprocess.run(
+            ["git", "ls-files", "-z", "--", "."],  # noqa: S607
+            cwd=directory,
+            capture_output=True,
+            check=True,
+        ).stdout.decode()
+    except (OSError, subprocess.CalledProcessError):
+        paths = [path for path in directory.iterdir() if path.suffix in DATA_SUFFIXES]
+    else:
+        # Files of the subdirectories belong to their own section
+        paths = [directory / name for name in tracked.split("\0") if name and "/" not in name]
+    # The README only feeds the section index that sphinx-gallery always rewrites
+    return sorted(
+        path
+        for path in paths
+        if path.is_file() and path.suffix != ".py" and path.name != "README.rst"
+    )
+
+
+@functools.cache
+def data_fingerprint(directory):
+    """Return a hash of the data files stored next to the examples of ``directory``."""
+    digest = hashlib.sha256()
+    for path in data_files(directory):
+        digest.update(path.name.encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def example_key(source, fingerprint, tag=""):
+    """Return the cache key of an example script."""
+    digest = hashlib.sha256(fingerprint.encode())
+    digest.update(tag.encode())
+    digest.update(data_fingerprint(Path(source).parent).encode())
+    digest.update(Path(source).read_bytes())
+    return digest.hexdigest()
+
+
+def iter_sections(app):
+    """Yield ``(target_dir, sources)`` for every directory of gallery examples."""
+    sections = {}
+    for source, target_dir in iter_examples(app):
+        sections.setdefault(target_dir, []).append(source)
+    yield from sections.items()
+
+
+def iter_examples(app):
+    """Yield ``(source, target_dir)`` for every script of the gallery."""
+    gallery_conf = app.config.sphinx_gallery_conf
+    ignore_pattern = gallery_conf.get("ignore_pattern", r"__init__\.py")
+    srcdir = Path(app.srcdir)
+    for examples_dir, gallery_dir in zip(
+        gallery_conf["examples_dirs"], gallery_conf["gallery_dirs"], strict=True
+    ):
+        examples_path = (srcdir / examples_dir).resolve()
+        for source in sorted(examples_path.rglob("*.py")):
+            if re.search(ignore_pattern, os.path.normpath(source)):
+                continue
+            yield source, srcdir / gallery_dir / source.parent.relative_to(examples_path)
+
+
+def example_outputs(source, target_dir):
+    """Yield the files sphinx-gallery generated for an example."""
+    stem = source.stem
+    yield from target_dir.glob(f"{stem}.*")
+    yield from (target_dir / "images").glob(f"sphx_glr_{stem}_[0-9][0-9][0-9].*")
+    yield from (target_dir / "images" / "thumb").glob(f"sphx_glr_{stem}_thumb.*")
+
+
+def is_current(source, target_dir):
+    """Return ``True`` when sphinx-gallery would skip executing ``source``."""
+    target = target_dir / source.name
+    return (
+        target.exists()
+        and target.with_name(f"{target.name}.md5").exists()
+        and target.read_bytes() == source.read_bytes()
+    )
+
+
+def _entry(app, source):
+    key = example_key(source, environment_fingerprint(app.confdir), app.config.gallery_cache_tag)
+    return Path(app.config.gallery_cache_dir) / key[:2] / key
+
+
+def _section_stamp(app, source_dir):
+    return f"{app.config.gallery_cache_tag}:{data_fingerprint(source_dir)}"
+
+
+def invalidate_changed_sections(app) -> None:
+    """Mark the examples of the sections whose data files or tag changed as out of date."""
+    for target_dir, sources in iter_sections(app):
+        stamp = target_dir / DATA_STAMP
+        if stamp.exists() and stamp.read_text() == _section_stamp(app, sources[0].parent):
+            continue
+        for source in sources:
+            # Without its md5 file sphinx-gallery executes the example again
+            (target_dir / f"{source.name}.md5").unlink(missing_ok=True)
+
+
+def write_section_stamps(app) -> None:
+    """Record the data fingerprint and tag of every section of the gallery."""
+    for target_dir, sources in iter_sections(app):
+        if target_dir.is_dir():
+            (target_dir / DATA_STAMP).write_text(_section_stamp(app, sources[0].parent))
+
+
+def restore_gallery(app) -> None:
+    """Copy cached outputs of unchanged examples into the gallery."""
+    invalidate_changed_sections(app)
+    if not app.config.gallery_cache_dir:
+        return
+    restored = 0
+    for source, target_dir in iter_examples(app):
+        entry = _entry(app, source)
+        if is_current(source, target_dir) or not entry.is_dir():
+            continue
+        for output in example_outputs(source, target_dir):
+            output.unlink()
+        shutil.copytree(entry, target_dir, dirs_exist_ok=True)
+        restored += 1
+    logger.info(
+        "gallery cache: restored %d examples from %s", restored, app.config.gallery_cache_dir
+    )
+
+
+def store_gallery(app, exception) -> None:
+    """Store the outputs of every successfully executed example."""
+    if exception is not None:
+        return
+    write_section_stamps(app)
+    if not app.config.gallery_cache_dir:
+        return
+    failing = {
+        Path(src).resolve() for src in app.config.sphinx_gallery_conf.get("failing_examples", {})
+    }
+    stored = 0
+    for source, target_dir in iter_examples(app):
+        entry = _entry(app, source)
+        if entry.is_dir() or source in failing or not is_current(source, target_dir):
+            continue
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=entry.parent))
+        for output in example_outputs(source, target_dir):
+            dest = staging / output.relative_to(target_dir)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(output, dest)
+        try:
+            staging.rename(entry)
+        except OSError:
+            # Another build stored the same entry in the meantime
+            shutil.rmtree(staging)
+        else:
+            stored += 1
+    logger.info("gallery cache: stored %d examples in %s", stored, app.config.gallery_cache_dir)
+
+
+def setup(app):
+    app.add_config_value("gallery_cache_dir", "", "")
+    app.add_config_value("gallery_cache_tag", "", "")
+    # sphinx-gallery executes the examples in its own builder-inited handler,
+    # which runs at the default priority of 500
+    app.connect("builder-inited", restore_gallery, priority=400)
+    app.connect("build-finished", store_gallery)
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -0,0 +1,121 @@
+"""
+Recompress and deduplicate the PNG figures of the HTML build.
+
+Every ``plot()`` and ``show()`` call of the gallery is scraped into a full size
+PNG and many lessons render almost the same scene several times, for example
+when only a display option changes between two plots. Once the HTML pages are
+written, this extension:
+
+* recompresses every PNG of the ``_images`` directories with the best lossless
+  zlib settings of Pillow, keeping the original file when it is smaller, and
+* moves the images into ``_images/shared/<hash>.png``, keyed by a hash of their
+  pixels, and rewrites the pages to reference the shared copy, so that identical
+  figures are stored and downloaded only once.
+
+Both steps leave the pixels untouched. They also apply to every language of the
+``mini18n-html`` build, each language having its own ``_images`` directory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+from sphinx.util import logging
+
+logger = logging.getLogger(__name__)
+
+SHARED_DIR = "shared"
+
+# ``src``, ``srcset`` and ``href`` attributes pointing to an image of ``_images``
+IMAGE_REFERENCE = re.compile(r"(?<=_images/)([^\"'\s<>?#/]+\.png)\b")
+
+
+def recompress(path):
+    """Recompress ``path`` losslessly and return the hash of its pixels."""
+    data = path.read_bytes()
+    with Image.open(io.BytesIO(data)) as image:
+        image.load()
+        digest = hashlib.sha256(f"{image.mode} {image.size}".encode())
+        digest.update(image.tobytes())
+        # The pixels of palette images are indices, the colors are elsewhere
+        digest.update(repr((image.getpalette(), image.info.get("transparency"))).encode())
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG", optimize=True)
+    if buffer.tell() < len(data):
+        path.write_bytes(buffer.getvalue())
+    return digest.hexdigest()[:32]
+
+
+def deduplicate(images_dir, jobs=None):
+    """
+    Move the PNG files of ``images_dir`` into its shared store.
+
+    Return a mapping of the original file names to their shared copy, and the
+    number of bytes saved.
+    """
+    shared_dir = images_dir / SHARED_DIR
+    shared_dir.mkdir(exist_ok=True)
+    paths = sorted(images_dir.glob("*.png"))
+    before = sum(path.stat().st_size for path in paths)
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        digests = list(pool.map(recompress, paths))
+
+    renamed = {}
+    after = 0
+    for path, digest in zip(paths, digests, strict=True):
+        shared = shared_dir / f"{digest}.png"
+        if shared.exists():
+            path.unlink()
+        else:
+            after += path.stat().st_size
+            path.replace(shared)
+        renamed[path.name] = f"{SHARED_DIR}/{shared.name}"
+    return renamed, before - after
+
+
+def rewrite_pages(root, renamed) -> int:
+    """Point the HTML pages under ``root`` to the shared images."""
+    rewritten = 0
+    for page in root.rglob("*.html"):
+        text = page.read_text(encoding="utf-8")
+        new = IMAGE_REFERENCE.sub(lambda match: renamed.get(match[1], match[1]), text)
+        if new != text:
+            page.write_text(new, encoding="utf-8")
+            rewritten += 1
+    return rewritten
+
+
+def optimize_images(app, exception) -> None:
+    """Recompress and deduplicate the images of every ``_images`` directory."""
+    if exception is not None or not app.config.gallery_images_optimize:
+        return
+    if app.builder.format != "html":
+        return
+    for images_dir in sorted(Path(app.outdir).rglob("_images")):
+        if not images_dir.is_dir():
+            continue
+        renamed, saved = deduplicate(images_dir, jobs=os.cpu_count())
+        if not renamed:
+            continue
+        rewritten = rewrite_pages(images_dir.parent, renamed)
+        logger.info(
+            "gallery images: %d PNG files in %s stored as %d shared files, "
+            "%.1f MiB saved, %d pages updated",
+            len(renamed),
+            images_dir,
+            len(set(renamed.values())),
+            saved / 2**20,
+            rewritten,
+        )
+
+
+def setup(app):
+    app.add_config_value("gallery_images_optimize", True, "")  # noqa: FBT003
+    app.connect("build-finished", optimize_images)
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -0,0 +1,184 @@
+"""
+Per-example cost report for the sphinx-gallery build.
+
+:class:`ExampleProfiler` is registered as a sphinx-gallery reset module that
+runs before and after every executed example. It records the wall time, CPU
+time, peak resident memory, number of frames rendered by the render windows of
+PyVista plotters (including the renders made through VTK directly, for example
+by ``ren_win.Render()``) and number of bytes downloaded with ``requests`` (which
+includes ``pyvista.examples``) and writes one JSON record per example. This works the same in serial and parallel
+builds since the records are written by the process executing the example.
+
+At the end of the build this extension merges the records into
+``report.json`` and ``report.csv`` and logs the examples sorted by wall time.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from sphinx.util import logging
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ["example", "wall_time", "cpu_time", "peak_rss", "frames", "downloaded"]
+
+_counters = {"frames": 0, "downloaded": 0}
+_counters_installed = False
+
+
+def _install_counters() -> None:
+    """Count the frames rendered and the bytes downloaded by this process."""
+    global _counters_installed  # noqa: PLW0603
+    if _counters_installed:
+        return
+    # Only needed in the processes executing the examples
+    import requests  # noqa: PLC0415
+    from pyvista import Plotter  # noqa: PLC0415
+
+    init = Plotter.__init__
+    iter_content = requests.models.Response.iter_content
+
+    def count_frame(*args):
+        _counters["frames"] += 1
+
+    def counting_init(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        # Observe the window rather than ``Plotter.render``, which is bypassed
+        # by the examples rendering the window themselves
+        self.ren_win.AddObserver("RenderEvent", count_frame)
+
+    def counting_iter_content(self, *args, **kwargs):
+        # ``Response.content`` and pooch both read the body through this
+        for chunk in iter_content(self, *args, **kwargs):
+            _counters["downloaded"] += len(chunk)
+            yield chunk
+
+    Plotter.__init__ = counting_init
+    requests.models.Response.iter_content = counting_iter_content
+    _counters_installed = True
+
+
+def _reset_peak_rss() -> None:
+    # Linux resets the high water mark of the resident set size on request
+    with contextlib.suppress(OSError):
+        Path("/proc/self/clear_refs").write_text("5")
+
+
+def _peak_rss():
+    """Return the peak resident set size of this process in bytes."""
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return 0
+    # Lifetime peak, in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class ExampleProfiler:
+    """Record the cost of every gallery example."""
+
+    def __init__(self, profile_dir) -> None:
+        self.profile_dir = str(profile_dir)
+        self._start = None
+
+    def __call__(self, gallery_conf, fname, when):
+        """Start measuring before an example and write its record afterwards."""
+        if when == "before":
+            _install_counters()
+            _reset_peak_rss()
+            self._start = (time.perf_counter(), time.process_time(), dict(_counters))
+            return
+        if self._start is None:
+            return
+        wall, cpu, counters = self._start
+        record = {
+            "example": str(fname),
+            "wall_time": time.perf_counter() - wall,
+            "cpu_time": time.process_time() - cpu,
+            "peak_rss": _peak_rss(),
+            "frames": _counters["frames"] - counters["frames"],
+            "downloaded": _counters["downloaded"] - counters["downloaded"],
+        }
+        self._start = None
+        records_dir = Path(self.profile_dir) / "records"
+        records_dir.mkdir(parents=True, exist_ok=True)
+        path = records_dir / f"{Path(fname).stem}-{uuid.uuid4().hex[:8]}.json"
+        path.write_text(json.dumps(record), encoding="utf-8")
+
+    def __repr__(self) -> str:
+        return "ExampleProfiler"
+
+
+def _records_dir(app):
+    return Path(app.config.gallery_profile_dir) / "records"
+
+
+def clear_records(app) -> None:
+    """Remove the records left over by a previous build."""
+    if not app.config.gallery_profile_dir:
+        return
+    for path in _records_dir(app).glob("*.json"):
+        path.unlink()
+
+
+def format_table(records):
+    """Return the records as a plain text table sorted by wall time."""
+    header = (
+        f"{'example':<45} {'wall [s]':>9} {'cpu [s]':>9} {'peak RSS [MiB]':>15} "
+        f"{'frames':>7} {'downloaded [MiB]':>17}"
+    )
+    lines = [header, "-" * len(header)]
+    lines.extend(
+        f"{record['example']:<45} {record['wall_time']:>9.2f} {record['cpu_time']:>9.2f} "
+        f"{record['peak_rss'] / 2**20:>15.1f} {record['frames']:>7d} "
+        f"{record['downloaded'] / 2**20:>17.1f}"
+        for record in records
+    )
+    return "\n".join(lines)
+
+
+def write_report(app, exception) -> None:
+    """Merge the records into ``report.json`` and ``report.csv``."""
+    if not app.config.gallery_profile_dir:
+        return
+    records = [
+        json.loads(path.read_text(encoding="utf-8")) for path in _records_dir(app).glob("*.json")
+    ]
+    report_dir = Path(app.config.gallery_profile_dir)
+    if not records:
+        # Do not leave the report of an earlier build for this one
+        for name in ("report.json", "report.csv"):
+            (report_dir / name).unlink(missing_ok=True)
+        logger.info("gallery profile: no example was executed")
+        return
+    records.sort(key=lambda record: record["wall_time"], reverse=True)
+    (report_dir / "report.json").write_text(json.dumps(records, indent=2) + "\n", encoding="utf-8")
+    with (report_dir / "report.csv").open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+    logger.info("gallery profile written to %s\n%s", report_dir, format_table(records))
+
+
+def setup(app):
+    app.add_config_value("gallery_profile_dir", "", "")
+    app.connect("builder-inited", clear_records, priority=400)
+    app.connect("build-finished", write_report)
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -0,0 +1,199 @@
+"""
+Prefetch every dataset the tutorial downloads with ``pyvista.examples``.
+
+The tutorial scripts and the ``pyvista-plot`` directives of the README files
+call ``examples.download_*`` lazily, one at a time, while the gallery runs.
+This script statically scans the tutorial tree for those calls, writes a
+manifest of the required datasets and downloads them concurrently into
+``PYVISTA_EXAMPLE_DATA_PATH`` so that a build never waits on the network in
+the middle of an example.
+
+Usage::
+
+    python doc/source/prefetch_datasets.py --manifest datasets.json --jobs 8
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import inspect
+import json
+import logging
+import operator
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+logger = logging.getLogger("prefetch_datasets")
+
+TUTORIAL_DIR = Path(__file__).absolute().parents[2] / "tutorial"
+
+# Calls inside ``pyvista-plot`` and ``code`` blocks of the reStructuredText files
+RST_CALL = re.compile(r"examples\.(?:\w+\.)?download_\w+\([^()]*\)")
+
+
+class Dataset:
+    def __init__(self, function, args=(), kwargs=None) -> None:
+        self.function = function
+        self.args = tuple(args)
+        self.kwargs = dict(kwargs or {})
+        self.sources = set()
+
+    @property
+    def key(self):
+        return self.function, self.args, tuple(sorted(self.kwargs.items()))
+
+    def to_dict(self):
+        return {
+            "function": self.function,
+            "args": list(self.args),
+            "kwargs": self.kwargs,
+            "sources": sorted(self.sources),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        dataset = cls(data["function"], data["args"], data["kwargs"])
+        dataset.sources.update(data.get("sources", []))
+        return dataset
+
+
+def _download_function(node):
+    """Return the name of the ``examples`` download function called by ``node``."""
+    chain = []
+    func = node.func
+    while isinstance(func, ast.Attribute):
+        chain.append(func.attr)
+        func = func.value
+    if isinstance(func, ast.Name):
+        chain.append(func.id)
+    chain.reverse()
+    if not chain or not chain[-1].startswith("download_"):
+        return None
+    if "examples" in chain:
+        # e.g. ``examples.download_lucy`` or ``pv.examples.planets.download_mars_surface``
+        return ".".join(chain[chain.index("examples") + 1 :]).removeprefix("downloads.")
+    if len(chain) == 1:
+        # e.g. ``from pyvista.examples import download_lucy``
+        return chain[0]
+    return None
+
+
+def scan_source(source, origin):
+    """Yield every ``examples.download_*`` call with literal arguments in ``source``."""
+    # The trame lessons are notebooks and use top-level ``await``
+    tree = compile(source, origin, "exec", ast.PyCF_ONLY_AST | ast.PyCF_ALLOW_TOP_LEVEL_AWAIT)
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        function = _download_function(node)
+        if function is None:
+            continue
+        if any(kw.arg is None for kw in node.keywords):
+            logger.warning("%s: skipping %s with unpacked keyword arguments", origin, function)
+            continue
+        try:
+            args = [ast.literal_eval(arg) for arg in node.args]
+            kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in node.keywords}
+        except (TypeError, ValueError):
+            logger.warning("%s: skipping %s with non-literal arguments", origin, function)
+            continue
+        dataset = Dataset(function, args, kwargs)
+        dataset.sources.add(origin)
+        yield dataset
+
+
+def scan(root=TUTORIAL_DIR):
+    """Return the datasets downloaded anywhere under ``root``."""
+    root = Path(root)
+    datasets = {}
+    for path in sorted([*root.rglob("*.py"), *root.rglob("*.rst")]):
+        origin = path.relative_to(root.parent).as_posix()
+        if path.suffix == ".py":
+            sources = [path.read_text(encoding="utf-8")]
+        else:
+            sources = RST_CALL.findall(path.read_text(encoding="utf-8"))
+        for source in sources:
+            for dataset in scan_source(source, origin):
+                datasets.setdefault(dataset.key, dataset).sources.update(dataset.sources)
+    return sorted(datasets.values(), key=lambda dataset: dataset.key)
+
+
+def write_manifest(datasets, path) -> None:
+    """Write the datasets to a JSON manifest."""
+    manifest = {"datasets": [dataset.to_dict() for dataset in datasets]}
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+
+def read_manifest(path):
+    """Read the datasets of a JSON manifest."""
+    manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+    return [Dataset.from_dict(data) for data in manifest["datasets"]]
+
+
+def fetch(dataset, examples) -> None:
+    """Download a single dataset without loading it when possible."""
+    function = operator.attrgetter(dataset.function)(examples)
+    kwargs = dict(dataset.kwargs)
+    if "load" in inspect.signature(function).parameters:
+        kwargs["load"] = False
+    function(*dataset.args, **kwargs)
+
+
+def fetch_all(datasets, jobs=8):
+    """Download ``datasets`` concurrently and return the ones that failed."""
+    from pyvista import examples  # noqa: PLC0415
+
+    if os.environ.get("PYVISTA_TUTORIAL_MIRROR"):
+        import data_mirror  # noqa: PLC0415
+
+        data_mirror.install(os.environ["PYVISTA_TUTORIAL_MIRROR"])
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(fetch, dataset, examples): dataset for dataset in datasets}
+        for future in as_completed(futures):
+            dataset = futures[future]
+            try:
+                future.result()
+            except Exception:
+                logger.exception("failed to fetch %s", dataset.function)
+                failed.append(dataset)
+            else:
+                logger.info("fetched %s", dataset.function)
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--root", default=TUTORIAL_DIR, help="tutorial tree to scan")
+    parser.add_argument("--manifest", help="write the manifest of datasets to this file")
+    parser.add_argument("--from-manifest", help="fetch the datasets of an existing manifest")
+    parser.add_argument("--data-path", help="override PYVISTA_EXAMPLE_DATA_PATH")
+    parser.add_argument("--jobs", type=int, default=8, help="number of concurrent downloads")
+    parser.add_argument("--no-fetch", action="store_true", help="only write the manifest")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    datasets = read_manifest(args.from_manifest) if args.from_manifest else scan(args.root)
+    logger.info("%d datasets required by the tutorial", len(datasets))
+    if args.manifest:
+        write_manifest(datasets, args.manifest)
+    if args.no_fetch:
+        return 0
+
+    if args.data_path:
+        # pyvista reads this when ``pyvista.examples`` is first imported
+        os.environ["PYVISTA_EXAMPLE_DATA_PATH"] = str(Path(args.data_path).absolute())
+    failed = fetch_all(datasets, jobs=args.jobs)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
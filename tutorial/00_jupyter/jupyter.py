@@ -5,6 +5,7 @@ Test out PyVista's Jupyter Backend
 Become familiar with PyVista Jupyter backend.
 """
 
+import numpy as np
 import pyvista as pv
 
 # Set/enable the backed
@@ -24,6 +25,62 @@ pl = pv.Plotter()
 pl.add_mesh(pv.ParametricRandomHills().elevation())
 pl.show(jupyter_backend="client")
 
+# %%
+# With client-side rendering the geometry itself is sent to the browser, so
+# the size of the mesh arrays is what the notebook has to transfer. Only the
+# arrays needed for rendering are sent (the points, the cells, the normals,
+# the texture coordinates and the active scalars) but each of them can usually
+# be made smaller before calling ``show``:
+#
+# * points in single precision are half the size of double precision points,
+# * triangle strips need about a third of the connectivity of triangles,
+# * normals quantised to 8 bit integers are a quarter of the size of float
+#   normals. ``vtk.js`` normalises them when shading, so the scale is irrelevant,
+# * texture coordinates are not needed when no texture is applied.
+
+
+def compact_for_transport(mesh):
+    """Return a copy of ``mesh`` that is cheaper to send to the browser."""
+    compact = mesh.extract_surface().triangulate()
+    point_data = compact.point_data
+    # Strips are made from several triangles, they cannot hold cell scalars
+    if compact.cell_data.active_scalars_name is None:
+        compact = compact.strip()
+        point_data = compact.point_data
+    compact.points = compact.points.astype(np.float32)
+
+    normals = point_data.active_normals
+    normals_name = point_data.active_normals_name
+    if normals is not None:
+        point_data[normals_name] = np.round(normals * 127).astype(np.int8)
+        point_data.active_normals_name = normals_name
+
+    keep = {point_data.active_scalars_name, normals_name}
+    for name in list(point_data):
+        if name not in keep:
+            del point_data[name]
+    return compact
+
+
+def transport_size(mesh):
+    """Return the number of bytes of the arrays sent to the browser."""
+    arrays = [mesh.points, mesh.point_data.active_normals, mesh.active_scalars]
+    size = sum(array.nbytes for array in arrays if array is not None)
+    # Cells are sent as 32 bit integers in the legacy ``[n, id0, id1, ...]`` layout
+    cells = [mesh.verts, mesh.lines, mesh.faces, mesh.strips]
+    return size + sum(4 * cell.size for cell in cells)
+
+
+hills = pv.ParametricRandomHills().elevation()
+compact_hills = compact_for_transport(hills)
+f"{transport_size(hills) / 2**10:.0f} KiB -> {transport_size(compact_hills) / 2**10:.0f} KiB"
+
+# %%
+
+pl = pv.Plotter()
+pl.add_mesh(compact_hills)
+pl.show(jupyter_backend="client")
+
 
 # %%
 # Server-side rendering only
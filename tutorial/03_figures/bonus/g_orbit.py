@@ -18,12 +18,17 @@ with ``.show(auto_close=False)``.  You may also have to set
 .. note::
    Use ``lighting=False`` to reduce the size of the color space to avoid
    "jittery" GIFs when showing the scalar bar.
+   :ref:`compact_gif_example` avoids the jitter altogether with a global
+   palette and writes much smaller files.
 
 """
 
 # sphinx_gallery_thumbnail_number = 2
+import numpy as np
 import pyvista as pv
 from pyvista import examples
+from vtkmodules.util.numpy_support import vtk_to_numpy
+from vtkmodules.vtkRenderingCore import vtkWindowToImageFilter
 
 mesh = examples.download_st_helens().warp_by_scalar()
 
@@ -67,6 +72,56 @@ pl.open_gif("orbit.gif")
 pl.orbit_on_path(path, write_frames=True, viewup=viewup, step=0.05)
 pl.close()
 
+# %%
+# Render an orbit faster
+# ++++++++++++++++++++++
+# Only the camera moves during an orbit. The meshes and textures are uploaded
+# to the graphics card by the first render and stay there, so every frame
+# only costs a render and a read back of the image.
+#
+# :func:`pyvista.Plotter.orbit_on_path` adds a lot on top of that: it waits
+# ``step`` seconds between frames, processes window events and captures every
+# frame through a new screenshot. ``render_orbit`` below computes all camera
+# poses up front, reuses a single image capture and hands the frames straight
+# to a writer, such as ``pl.mwriter`` after :func:`pyvista.Plotter.open_gif` or
+# :func:`pyvista.Plotter.open_movie`, or an ``imageio`` writer.
+
+
+def render_orbit(plotter, path, writer, viewup=None, focus=None):
+    """Render one frame per point of ``path`` into ``writer``."""
+    renderer = plotter.renderer
+    camera = renderer.GetActiveCamera()
+    focus = plotter.center if focus is None else focus
+    viewup = camera.GetViewUp() if viewup is None else viewup
+    positions = np.asarray(path.points, dtype=float)
+
+    capture = vtkWindowToImageFilter()
+    capture.SetInput(plotter.ren_win)
+    capture.ReadFrontBufferOff()
+    capture.ShouldRerenderOff()
+    width, height = plotter.ren_win.GetSize()
+
+    camera.SetFocalPoint(focus)
+    for position in positions:
+        camera.SetPosition(position)
+        camera.SetViewUp(viewup)
+        renderer.ResetCameraClippingRange()
+        plotter.ren_win.Render()
+        capture.Modified()
+        capture.Update()
+        image = vtk_to_numpy(capture.GetOutput().GetPointData().GetScalars())
+        # VTK images start at the bottom row
+        writer.append_data(image.reshape(height, width, -1)[::-1])
+
+
+pl = pv.Plotter()
+pl.add_mesh(mesh)
+pl.show(auto_close=False)
+path = pl.generate_orbital_path(factor=2.0, n_points=36, viewup=viewup, shift=0.2)
+pl.open_gif("orbit.gif")
+render_orbit(pl, path, pl.mwriter, viewup=viewup)
+pl.close()
+
 # %%
 # .. raw:: html
 #
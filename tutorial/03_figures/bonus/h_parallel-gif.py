@@ -0,0 +1,276 @@
+"""
+.. _parallel_gif_example:
+
+Render Animations in Parallel
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Render the frames of an animation on every core and encode them while they
+are being rendered.
+
+In :ref:`gif_movie_example`, a single plotter updates the mesh, renders it and
+encodes the frame with :func:`pyvista.Plotter.write_frame`, so rendering and
+encoding take turns on one thread. The frames of most animations are
+independent from each other though: frame ``i`` only depends on ``i``. This
+lesson defines two small helpers, ``render_frames`` and ``write_animation``,
+that:
+
+* render the frames in a pool of worker processes, each with its own
+  off-screen :class:`pyvista.Plotter`,
+* stream the frames, in order, to an encoder running on a background thread,
+* keep a bounded number of frames in memory, however long the animation is.
+
+.. note::
+   The workers are started with ``fork`` so that they inherit the meshes of
+   the notebook. On platforms without ``fork`` (Windows), the frames are
+   rendered in the current process while the encoder still runs in the
+   background. The same goes for the build of this gallery, which should not
+   fork the process that executed the previous examples.
+
+"""
+
+import multiprocessing
+import os
+import queue
+import threading
+import traceback
+
+import imageio
+import numpy as np
+import pyvista as pv
+
+# %%
+# The encoder
+# +++++++++++
+# Frames are handed over to a background thread through a bounded queue. When
+# the encoder falls behind, ``write`` blocks instead of piling up frames in
+# memory. The thread only starts with the first frame: the rendering workers
+# are forked when the first frame is requested, and forking a process that
+# already runs threads can deadlock the children.
+
+
+class StreamingEncoder:
+    """Encode frames with ``imageio`` on a background thread."""
+
+    def __init__(self, filename, fps=10, maxsize=8):
+        if filename.endswith(".gif"):
+            options = {"mode": "I", "duration": 1000 / fps, "loop": 0}
+        else:
+            options = {"fps": fps}
+        self._writer = imageio.get_writer(filename, **options)
+        self._queue = queue.Queue(maxsize)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        # ``iter(self._queue.get, None)`` would compare the frames to ``None``
+        while (frame := self._queue.get()) is not None:
+            if self._error is not None:
+                # Keep draining the queue so that ``write`` never blocks
+                continue
+            try:
+                self._writer.append_data(frame)
+            except Exception as err:  # noqa: BLE001
+                self._error = err
+
+    def write(self, frame):
+        """Queue a frame for encoding."""
+        if self._error is not None:
+            raise self._error
+        if self._thread.ident is None:
+            self._thread.start()
+        self._queue.put(frame)
+
+    def close(self):
+        """Encode the remaining frames and finalize the file."""
+        if self._thread.ident is not None:
+            self._queue.put(None)
+            self._thread.join()
+        self._writer.close()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        """Return the encoder."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Finalize the file."""
+        self.close()
+
+
+def write_animation(filename, frames, fps=10):
+    """Encode ``frames`` to ``filename`` while they are being rendered."""
+    with StreamingEncoder(filename, fps=fps) as encoder:
+        for frame in frames:
+            encoder.write(frame)
+
+
+# %%
+# The renderers
+# +++++++++++++
+# Each worker calls ``setup()`` once to build its plotter, then renders the
+# frames it receives with ``update(plotter, index)``. The frames come back in
+# any order and are reordered before being yielded, while at most
+# ``max_pending`` frames are requested ahead of the next one to encode.
+
+
+def _render_frame(plotter, update, index):
+    """Return ``(index, image, error)`` for frame ``index``."""
+    try:
+        update(plotter, index)
+        # ``screenshot`` does not render the updated scene by itself
+        plotter.render()
+        return index, plotter.screenshot(return_img=True), None
+    except Exception:  # noqa: BLE001
+        return index, None, traceback.format_exc()
+
+
+def _render_worker(setup, update, tasks, results):
+    # Pending results are only left behind when the animation was aborted
+    results.cancel_join_thread()
+    plotter = setup()
+    try:
+        for index in iter(tasks.get, None):
+            results.put(_render_frame(plotter, update, index))
+    finally:
+        plotter.close()
+
+
+def _next_result(results, workers):
+    """Wait for the next frame rendered by ``workers``."""
+    while True:
+        try:
+            index, image, error = results.get(timeout=1)
+        except queue.Empty:
+            if not all(worker.is_alive() for worker in workers):
+                msg = "A rendering worker exited unexpectedly"
+                raise RuntimeError(msg) from None
+            continue
+        if error is not None:
+            msg = f"Rendering frame {index} failed:\n{error}"
+            raise RuntimeError(msg)
+        return index, image
+
+
+def _render_serial(setup, update, n_frames):
+    plotter = setup()
+    try:
+        for index in range(n_frames):
+            update(plotter, index)
+            plotter.render()
+            yield plotter.screenshot(return_img=True)
+    finally:
+        plotter.close()
+
+
+def render_frames(setup, update, n_frames, n_workers=None, max_pending=None):
+    """
+    Yield the ``n_frames`` frames of an animation in order.
+
+    ``setup()`` returns an off-screen plotter and ``update(plotter, index)``
+    prepares the scene of frame ``index``.
+    """
+    n_workers = min(n_workers or os.cpu_count(), n_frames)
+    if n_workers <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        yield from _render_serial(setup, update, n_frames)
+        return
+    max_pending = max_pending or 2 * n_workers
+
+    context = multiprocessing.get_context("fork")
+    tasks, results = context.Queue(), context.Queue()
+    workers = [
+        context.Process(target=_render_worker, args=(setup, update, tasks, results), daemon=True)
+        for _ in range(n_workers)
+    ]
+    for worker in workers:
+        worker.start()
+
+    submitted = 0
+    done = {}
+    try:
+        for index in range(n_frames):
+            while submitted < min(n_frames, index + max_pending):
+                tasks.put(submitted)
+                submitted += 1
+            while index not in done:
+                i, image = _next_result(results, workers)
+                done[i] = image
+            yield done.pop(index)
+    finally:
+        for _ in workers:
+            tasks.put(None)
+        for worker in workers:
+            worker.join(timeout=10)
+            if worker.is_alive():
+                worker.terminate()
+
+
+# %%
+# Animate a wave
+# ++++++++++++++
+# This is the wave of :ref:`gif_movie_example` with smoother motion. The grid
+# is created once; every worker inherits its own copy of it.
+
+x = np.arange(-10, 10, 0.5)
+y = np.arange(-10, 10, 0.5)
+x, y = np.meshgrid(x, y)
+r = np.sqrt(x**2 + y**2)
+z = np.sin(r)
+
+grid = pv.StructuredGrid(x, y, z)
+grid["Height"] = z.ravel()
+
+nframe = 60
+phases = np.linspace(0, 2 * np.pi, nframe + 1)[:nframe]
+
+
+def setup():
+    plotter = pv.Plotter(notebook=False, off_screen=True)
+    plotter.add_mesh(
+        grid,
+        scalars="Height",
+        lighting=False,
+        show_edges=True,
+        scalar_bar_args={"title": "Height"},
+        clim=[-1, 1],
+    )
+    return plotter
+
+
+def update(plotter, index):
+    z = np.sin(r + phases[index])
+    pts = grid.points.copy()
+    pts[:, -1] = z.ravel()
+    grid.points = pts
+    grid["Height"] = z.ravel()
+
+
+# %%
+# The plotter of the first frame opens the GIF with ``open_gif``, only so that
+# the gallery shows the GIF in place of its screenshot: its own writer is
+# closed right away and the frames are written by the encoder. In the serial case the frames update ``grid`` in
+# place, so the first frame is restored afterwards.
+
+n_workers = 1 if pv.BUILDING_GALLERY else None
+
+plotter = setup()
+plotter.open_gif("parallel-wave.gif")
+plotter.mwriter.close()
+write_animation("parallel-wave.gif", render_frames(setup, update, nframe, n_workers=n_workers))
+update(plotter, 0)
+plotter.show()
+
+# %%
+# The same helpers write movies, in which case the frames are encoded with
+# ``ffmpeg`` on the background thread:
+#
+# .. code:: python
+#
+#     write_animation("parallel-wave.mp4", render_frames(setup, update, nframe), fps=30)
+#
+# .. raw:: html
+#
+#     <center>
+#       <a target="_blank" href="https://colab.research.google.com/github/pyvista/pyvista-tutorial/blob/tutorial/notebooks/03_figures/bonus/h_parallel-gif.ipynb">
+#         <img src="https://colab.research.google.com/assets/colab-badge.svg" alt="Open In Colab"/ width="150px">
+#       </a>
+#     </center>
@@ -0,0 +1,173 @@
+"""
+.. _compact_gif_example:
+
+Compact GIFs
+~~~~~~~~~~~~
+Write smaller GIFs with a single palette and delta frames.
+
+A GIF frame holds at most 256 colors. :func:`pyvista.Plotter.open_gif`
+chooses a new palette for every frame, which is why the colors of shaded
+surfaces and scalar bars "jitter" from one frame to the next, and why the
+notes of :ref:`gif_movie_example` and :ref:`orbiting_example` recommend
+``lighting=False``.
+
+This lesson defines ``DeltaGifWriter``, which:
+
+* computes one global palette from frames sampled across the whole animation,
+* maps every frame to that palette, so the colors stay stable,
+* stores only the rectangle of pixels that changed since the previous frame,
+  with the unchanged pixels inside it left transparent.
+
+The writer keeps the frames in memory until it is closed, since the palette
+depends on all of them.
+
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pyvista as pv
+from PIL import Image
+from pyvista import examples
+
+# %%
+# The writer
+# ++++++++++
+# ``DeltaGifWriter`` has the ``append_data`` and ``close`` methods of the
+# ``imageio`` writers, so it can replace the writer that
+# :func:`pyvista.Plotter.open_gif` creates.
+
+# Palette index of the pixels that did not change since the previous frame
+TRANSPARENT = 255
+
+
+class DeltaGifWriter:
+    """Write a GIF with a global palette and delta frames."""
+
+    def __init__(self, filename, fps=10, n_samples=8, loop=0):
+        self.filename = filename
+        self.duration = 1000 / fps
+        self.n_samples = n_samples
+        self.loop = loop
+        self._frames = []
+
+    def append_data(self, frame):
+        """Add an RGB(A) frame to the animation."""
+        self._frames.append(np.asarray(frame)[..., :3].copy())
+
+    def _palette(self):
+        """Return a palette image of 255 colors sampled from the frames."""
+        step = max(len(self._frames) // self.n_samples, 1)
+        mosaic = Image.fromarray(np.concatenate(self._frames[::step]))
+        palette = mosaic.quantize(colors=TRANSPARENT, method=Image.Quantize.MEDIANCUT)
+        colors = palette.getpalette()[: 3 * TRANSPARENT]
+        colors += [0] * (3 * TRANSPARENT - len(colors))
+        # Duplicate the first color so that nothing is ever mapped to TRANSPARENT
+        palette.putpalette(colors + colors[:3])
+        return palette
+
+    def close(self):
+        """Encode the frames and write the file."""
+        if not self._frames:
+            return
+        palette = self._palette()
+        images = []
+        previous = None
+        for frame in self._frames:
+            indices = np.asarray(
+                Image.fromarray(frame).quantize(palette=palette, dither=Image.Dither.NONE)
+            ).copy()
+            indices[indices == TRANSPARENT] = 0
+            delta = indices.copy()
+            if previous is not None:
+                delta[indices == previous] = TRANSPARENT
+            previous = indices
+            image = Image.frombytes("P", (delta.shape[1], delta.shape[0]), delta.tobytes())
+            image.putpalette(palette.getpalette())
+            images.append(image)
+        # Pillow crops each frame to the rectangle that differs from the
+        # previous one and merges identical consecutive frames
+        images[0].save(
+            self.filename,
+            save_all=True,
+            append_images=images[1:],
+            duration=self.duration,
+            loop=self.loop,
+            disposal=1,
+            transparency=TRANSPARENT,
+            optimize=False,
+        )
+        self._frames = []
+
+
+def open_compact_gif(plotter, filename, fps=10):
+    """Open a GIF on ``plotter`` written by ``DeltaGifWriter``."""
+    plotter.open_gif(filename, fps=fps)
+    # Keep the bookkeeping of ``open_gif`` but replace its writer
+    plotter.mwriter.close()
+    plotter.mwriter = DeltaGifWriter(filename, fps=fps)
+
+
+# %%
+# Orbit with lighting
+# +++++++++++++++++++
+# The orbit of :ref:`orbiting_example`, this time with lighting enabled. With a
+# global palette the shading stays smooth across the whole orbit.
+
+mesh = examples.download_st_helens().warp_by_scalar()
+
+pl = pv.Plotter()
+pl.add_mesh(mesh)
+pl.camera.zoom(1.5)
+pl.show(auto_close=False)
+path = pl.generate_orbital_path(n_points=36, shift=mesh.length)
+open_compact_gif(pl, "compact-orbit.gif")
+pl.orbit_on_path(path, write_frames=True)
+pl.close()
+f"compact-orbit.gif: {Path('compact-orbit.gif').stat().st_size / 2**20:.2f} MiB"
+
+# %%
+# Wave
+# ++++
+# In the wave of :ref:`gif_movie_example` the camera does not move, so the
+# axes, the scalar bar and the background are only stored in the first frame.
+
+x = np.arange(-10, 10, 0.5)
+y = np.arange(-10, 10, 0.5)
+x, y = np.meshgrid(x, y)
+r = np.sqrt(x**2 + y**2)
+z = np.sin(r)
+
+grid = pv.StructuredGrid(x, y, z)
+grid["Height"] = z.ravel()
+
+plotter = pv.Plotter(notebook=False, off_screen=True)
+plotter.add_mesh(
+    grid,
+    scalars="Height",
+    show_edges=True,
+    scalar_bar_args={"title": "Height"},
+    clim=[-1, 1],
+)
+open_compact_gif(plotter, "compact-wave.gif")
+
+pts = grid.points.copy()
+nframe = 15
+for phase in np.linspace(0, 2 * np.pi, nframe + 1)[:nframe]:
+    z = np.sin(r + phase)
+    pts[:, -1] = z.ravel()
+    grid.points = pts
+    grid["Height"] = z.ravel()
+    plotter.write_frame()
+
+plotter.close()
+f"compact-wave.gif: {Path('compact-wave.gif').stat().st_size / 2**20:.2f} MiB"
+
+# %%
+# .. raw:: html
+#
+#     <center>
+#       <a target="_blank" href="https://colab.research.google.com/github/pyvista/pyvista-tutorial/blob/tutorial/notebooks/03_figures/bonus/i_compact-gif.ipynb">
+#         <img src="https://colab.research.google.com/assets/colab-badge.svg" alt="Open In Colab"/ width="150px">
+#       </a>
+#     </center>
@@ -8,6 +8,8 @@ Generate a moving gif from an active plotter.
 .. note::
    Use ``lighting=False`` to reduce the size of the color space to avoid
    "jittery" GIFs, especially for the scalar bar.
+   :ref:`compact_gif_example` avoids the jitter altogether with a global
+   palette and writes much smaller files.
 
 """
 
@@ -55,6 +57,10 @@ for phase in np.linspace(0, 2 * np.pi, nframe + 1)[:nframe]:
 plotter.close()
 
 # %%
+# .. tip::
+#    Rendering and encoding alternate on a single thread here. See
+#    :ref:`parallel_gif_example` to render long animations on every core.
+#
 # .. raw:: html
 #
 #     <center>
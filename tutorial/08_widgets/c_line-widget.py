@@ -52,6 +52,74 @@ pl.show()
 #
 # .. image:: ../../images/gifs/line-widget-streamlines.gif
 
+# %%
+# Reusing the tracer
+# ++++++++++++++++++
+# Every call to :func:`pyvista.DataSetFilters.streamlines` creates a new
+# ``vtkStreamTracer`` and sets the active vectors of the mesh. Changing the
+# mesh invalidates the locators that VTK keeps on it to find the cell
+# containing each integration point, so they are rebuilt on every move of the
+# widget.
+#
+# ``StreamlineTracer`` sets up the velocity field, the locators and the
+# pipeline once. Moving the widget only moves the seed line and integrates
+# the new seeds. The seeds are integrated on ``threads`` threads, all the
+# cores by default, or serially with ``threads=1``.
+
+from vtkmodules.vtkCommonCore import vtkSMPTools
+from vtkmodules.vtkFiltersFlowPaths import vtkStreamTracer
+from vtkmodules.vtkFiltersSources import vtkLineSource
+
+
+class StreamlineTracer:
+    """Trace streamlines of a vector field from a line of seeds."""
+
+    def __init__(self, mesh, vectors, n_points=10, max_steps=100, threads=None):
+        mesh.set_active_vectors(vectors)
+        # Built once, kept by the mesh as long as it is not modified
+        mesh.BuildPointLocator()
+        self.seeds = vtkLineSource()
+        self.seeds.SetResolution(n_points)
+
+        self.tracer = vtkStreamTracer()
+        self.tracer.SetInputDataObject(mesh)
+        self.tracer.SetSourceConnection(self.seeds.GetOutputPort())
+        self.tracer.SetInterpolatorTypeToDataSetPointLocator()
+        self.tracer.SetIntegratorTypeToRungeKutta45()
+        self.tracer.SetIntegrationDirectionToForward()
+        self.tracer.SetMaximumNumberOfSteps(max_steps)
+        self.tracer.SetMaximumPropagation(4 * mesh.length)
+        if threads == 1:
+            self.tracer.ForceSerialExecutionOn()
+        else:
+            vtkSMPTools.Initialize(threads or 0)
+
+    def trace(self, pointa, pointb):
+        """Return the streamlines seeded along the line from ``pointa`` to ``pointb``."""
+        self.seeds.SetPoint1(*pointa)
+        self.seeds.SetPoint2(*pointb)
+        self.tracer.Update()
+        return pv.wrap(self.tracer.GetOutput())
+
+
+tracer = StreamlineTracer(mesh, "velocity")
+
+pl = pv.Plotter()
+pl.add_mesh(furniture, name="furniture", color=True)
+pl.add_mesh(mesh.outline(), color="black")
+pl.add_axes()
+
+
+def simulate(pointa, pointb) -> None:
+    streamlines = tracer.trace(pointa, pointb)
+    pl.add_mesh(
+        streamlines, name="streamlines", line_width=5, render_lines_as_tubes=True, clim=clim
+    )
+
+
+pl.add_line_widget(callback=simulate, use_vertices=True)
+pl.show()
+
 # %%
 # .. raw:: html
 #
@@ -1,4 +1,6 @@
 """
+.. _multi_slider_widget_example:
+
 Multiple Slider Widgets
 ~~~~~~~~~~~~~~~~~~~~~~~
 
@@ -77,6 +79,122 @@ pl.show()
 #
 # .. image:: ../../images/gifs/multiple-slider-widget.gif
 
+# %%
+# Expensive callbacks
+# +++++++++++++++++++
+# The callbacks of the widgets run inside the VTK interaction events, so the
+# scene freezes until they return. At a resolution of a few hundred,
+# generating the sphere takes longer than a frame and dragging the sliders
+# stutters.
+#
+# ``BackgroundCallback`` moves the work to a worker thread. The widget only
+# records the new value and the result is swapped into the scene once it is
+# ready, with the values received in the meantime dropped except for the
+# latest one.
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BackgroundCallback:
+    """
+    Run an expensive widget callback on a worker thread.
+
+    ``compute(*args)`` runs on the worker and returns a result that
+    ``apply(result)`` swaps into the scene on the main thread, between two
+    renders. Values received while ``compute`` runs replace each other: only
+    the latest one is computed next. Until the interactor runs, for instance
+    when the widget calls back while being created, calls are synchronous.
+    """
+
+    def __init__(self, plotter, compute, apply, interval=15):
+        self.plotter = plotter
+        self.compute = compute
+        self.apply = apply
+        # Milliseconds between two checks for a result
+        self.interval = interval
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._future = None
+        self._latest = None
+        self._timer = None
+        self._observing = False
+
+    def __call__(self, *args):
+        iren = self.plotter.iren
+        if iren is None or not iren.initialized:
+            self.apply(self.compute(*args))
+            return
+        if self._future is None:
+            self._future = self._executor.submit(self.compute, *args)
+        else:
+            self._latest = args
+        if not self._observing:
+            iren.add_observer("TimerEvent", self._poll)
+            self._observing = True
+        if self._timer is None:
+            self._timer = iren.create_timer(self.interval)
+
+    def _poll(self, *args):
+        if self._future is None or not self._future.done():
+            return
+        future, self._future = self._future, None
+        if self._latest is not None:
+            self._future = self._executor.submit(self.compute, *self._latest)
+            self._latest = None
+        else:
+            self.plotter.iren.destroy_timer(self._timer)
+            self._timer = None
+        self.apply(future.result())
+        self.plotter.render()
+
+
+class BackgroundRoutine(MyCustomRoutine):
+    def __init__(self, mesh, plotter) -> None:
+        super().__init__(mesh)
+        self.background = BackgroundCallback(plotter, self.compute, self.output.copy_from)
+
+    def compute(self, kwargs):
+        return pv.Sphere(**kwargs)
+
+    def update(self) -> None:
+        # Pass a copy, the sliders keep changing ``self.kwargs``
+        self.background(dict(self.kwargs))
+
+
+# %%
+
+starting_mesh = pv.Sphere()
+pl = pv.Plotter()
+engine = BackgroundRoutine(starting_mesh, pl)
+pl.add_mesh(starting_mesh, show_edges=True)
+pl.add_slider_widget(
+    callback=lambda value: engine("phi_resolution", int(value)),
+    rng=[3, 600],
+    value=30,
+    title="Phi Resolution",
+    pointa=(0.025, 0.1),
+    pointb=(0.31, 0.1),
+    style="modern",
+)
+pl.add_slider_widget(
+    callback=lambda value: engine("theta_resolution", int(value)),
+    rng=[3, 600],
+    value=30,
+    title="Theta Resolution",
+    pointa=(0.35, 0.1),
+    pointb=(0.64, 0.1),
+    style="modern",
+)
+pl.add_slider_widget(
+    callback=lambda value: engine("radius", value),
+    rng=[0.1, 1.5],
+    value=0.5,
+    title="Radius",
+    pointa=(0.67, 0.1),
+    pointb=(0.98, 0.1),
+    style="modern",
+)
+pl.show()
+
 # %%
 # .. raw:: html
 #
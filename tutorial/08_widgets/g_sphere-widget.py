@@ -166,6 +166,126 @@ pl.show()
 #
 # .. image:: ../../images/gifs/sphere-widget-c.gif
 
+# %%
+# The cubic interpolation runs every time a widget moves, inside the
+# interaction event. The ``BackgroundCallback`` of
+# :ref:`multi_slider_widget_example` can run it on a worker thread instead,
+# while Example D makes the interpolation itself cheaper.
+
+# %%
+# Example D
+# +++++++++
+#
+# ``griddata`` starts from scratch on every call: it triangulates the control
+# points and fits the surface again over the whole grid. ``InterpolationSurface``
+# interpolates the control points with a thin plate spline instead, and keeps
+# the kernel between the grid and each control point. The kernel is filled
+# column by column, so no temporary larger than a column is ever allocated,
+# and moving a point only recomputes its own column.
+#
+# What happens next depends on the move:
+#
+# * A point moved sideways, as the sphere widgets almost always are, changes
+#   the small system solved for the spline weights. It is factorized again,
+#   which only depends on the number of control points, and the surface is
+#   evaluated with one matrix-vector product over the grid.
+# * A point moved vertically keeps the factorization. The surface is updated
+#   with the cardinal function of that point, the surface of height one at it
+#   and zero at the others, which is computed once and then costs one column
+#   update per move.
+#
+# The kernel holds one value per grid point and control point, pass
+# ``dtype=np.float32`` to halve it on large grids.
+
+from scipy.linalg import lu_factor, lu_solve
+
+
+def thin_plate(r):
+    """Return the thin plate spline kernel of the distances ``r``."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(r > 0, r**2 * np.log(r), 0)
+
+
+class InterpolationSurface:
+    """Thin plate spline through control points, evaluated on a fixed grid."""
+
+    def __init__(self, grid, controls, dtype=np.float64):
+        self.grid = np.asarray(grid, dtype=float)[:, :2]
+        self.controls = np.array(controls, dtype=float)
+        self._kernel = np.empty((len(self.grid), len(self.controls)), dtype=dtype)
+        for i in range(len(self.controls)):
+            self._update_kernel(i)
+        self._affine = np.column_stack((np.ones(len(self.grid)), self.grid)).astype(dtype)
+        self._factorization = None
+        self._cardinal = {}
+        self._heights = None
+
+    def _update_kernel(self, i):
+        distances = np.linalg.norm(self.grid - self.controls[i, :2], axis=1)
+        self._kernel[:, i] = thin_plate(distances)
+
+    def move(self, i, point):
+        """Move the control point ``i`` to ``point``."""
+        point = np.asarray(point, dtype=float)
+        if np.array_equal(point[:2], self.controls[i, :2]):
+            if self._heights is not None:
+                self._heights += self._cardinal_function(i) * (point[2] - self.controls[i, 2])
+            self.controls[i, 2] = point[2]
+            return
+        self.controls[i] = point
+        self._update_kernel(i)
+        self._factorization = None
+        self._cardinal.clear()
+        self._heights = None
+
+    def _factorize(self):
+        n = len(self.controls)
+        xy = self.controls[:, :2]
+        system = np.zeros((n + 3, n + 3))
+        system[:n, :n] = thin_plate(np.linalg.norm(xy[:, None] - xy[None], axis=-1))
+        system[:n, n:] = np.column_stack((np.ones(n), xy))
+        system[n:, :n] = system[:n, n:].T
+        return lu_factor(system)
+
+    def _interpolate(self, values):
+        """Return the spline through ``values`` at the control points on the grid."""
+        if self._factorization is None:
+            self._factorization = self._factorize()
+        n = len(self.controls)
+        weights = lu_solve(self._factorization, np.concatenate((values, np.zeros(3))))
+        return self._kernel @ weights[:n].astype(self._kernel.dtype) + self._affine @ weights[n:]
+
+    def _cardinal_function(self, i):
+        if i not in self._cardinal:
+            self._cardinal[i] = self._interpolate(np.eye(len(self.controls))[i])
+        return self._cardinal[i]
+
+    def evaluate(self):
+        """Return the height of the surface at every grid point."""
+        if self._heights is None:
+            self._heights = self._interpolate(self.controls[:, 2])
+        return self._heights
+
+
+# %%
+# The surface interpolates the four widgets and the four corners. Only the
+# widgets move, they are the first control points.
+
+surface = InterpolationSurface(surf.points, np.vstack((points, boundaries)))
+surf.points[:, -1] = surface.evaluate()
+
+
+def update_spline(point, i) -> None:
+    surface.move(i, point)
+    surf.points[:, -1] = surface.evaluate()
+
+
+pl = pv.Plotter()
+pl.add_mesh(surf, color=True)
+pl.add_sphere_widget(update_spline, center=points, color=colors, radius=3)
+pl.show_grid()
+pl.show()
+
 # %%
 # .. raw:: html
 #
@@ -67,3 +67,63 @@ with SinglePageLayout(viewer.server) as layout:
 # Show UI
 await layout.ready
 layout
+
+# %%
+# Progressive level of detail
+#
+# In **Local** mode, vtk.js only draws the first frame once it received the
+# whole geometry, which takes a while for the millions of triangles of Lucy.
+# Instead, this application first shows a coarse proxy of a few thousand
+# triangles and then replaces it by finer levels of detail, computed on a
+# worker thread, until the full mesh is shown. The first frame no longer
+# depends on the size of the mesh.
+
+import asyncio
+
+from trame.app import get_server
+from vtkmodules.vtkFiltersCore import vtkQuadricClustering
+
+# Number of divisions along each axis of the proxies, coarsest first
+LOD_DIVISIONS = (64, 256)
+
+
+def level_of_detail(mesh, divisions=None):
+    """Return ``mesh`` clustered on a ``divisions`` grid, with point normals."""
+    if divisions is not None:
+        clustering = vtkQuadricClustering()
+        clustering.SetInputData(mesh)
+        clustering.SetNumberOfDivisions(divisions, divisions, divisions)
+        clustering.Update()
+        mesh = pv.wrap(clustering.GetOutput())
+    return mesh.compute_normals(cell_normals=False, split_vertices=False)
+
+
+lod = level_of_detail(dataset, LOD_DIVISIONS[0])
+
+lod_plotter = pv.Plotter()
+lod_plotter.add_mesh(lod, color="white")
+lod_viewer = get_viewer(lod_plotter, server=get_server("progressive_lod"))
+
+with SinglePageLayout(lod_viewer.server) as lod_layout:
+    with lod_layout.toolbar.clear() as tb:
+        tb.density = "compact"
+        tb.theme = "dark"
+        lod_viewer.ui_controls(mode="trame")
+    with lod_layout.content:
+        lod_view = lod_viewer.ui(add_menu=False, mode="trame", default_server_rendering=False)
+
+
+async def refine() -> None:
+    """Replace the proxy by finer levels of detail, ending with the full mesh."""
+    loop = asyncio.get_running_loop()
+    for divisions in (*LOD_DIVISIONS[1:], None):
+        level = await loop.run_in_executor(None, level_of_detail, dataset, divisions)
+        # Keep the actor and swap its geometry
+        lod.shallow_copy(level)
+        lod_view.update()
+
+
+await lod_layout.ready
+# The global reference keeps the task alive until it is done
+refinement = asyncio.ensure_future(refine())  # noqa: RUF006
+lod_layout
@@ -5,10 +5,21 @@ Using VTK/PyVista and Trame
 In this application, we will connect a VTK filter with PyVista.
 
 It will use Trame to visualize the results and interactively control
-parameters of the VTK filter.
+parameters of the VTK filter. The filter runs on a worker thread so that the
+application stays responsive while it computes, and the images sent while
+rotating the view adapt to the time it takes to encode and transfer them.
 
 """
 
+import asyncio
+import collections
+import functools
+import logging
+import math
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pyvista as pv
 from pyvista import examples
 from trame.app import get_server
@@ -18,31 +29,235 @@ from trame.widgets import vuetify3 as v3
 from vtkmodules.vtkFiltersGeneral import vtkWarpScalar
 
 mesh = examples.load_random_hills()
-warp_by_scalar = vtkWarpScalar()
-warp_by_scalar.SetInputData(mesh)
-warp_by_scalar.SetScaleFactor(0.3)
+
+
+def warp(scale):
+    """Warp the hills along their normals by ``scale`` times the elevation."""
+    warp_by_scalar = vtkWarpScalar()
+    warp_by_scalar.SetInputData(mesh)
+    warp_by_scalar.SetScaleFactor(scale)
+    warp_by_scalar.Update()
+    return pv.wrap(warp_by_scalar.GetOutput())
+
+
+warped = warp(0.3)
 
 plotter = pv.Plotter()
-actor = plotter.add_mesh(warp_by_scalar)
+actor = plotter.add_mesh(warped)
 plotter.reset_camera()
 
 # Trame server setup
 server = get_server("trame_vtk_example")
 state, ctrl = server.state, server.controller
 
+logger = logging.getLogger(__name__)
+
+
+class FilterExecutor:
+    """
+    Run filter updates off the event loop and show the latest result.
+
+    ``submit(func, *args)`` runs ``func`` on ``executor``, a single worker
+    thread by default, so the trame event loop keeps serving every client
+    while the filter runs. ``func`` must return a new dataset, which is copied
+    into ``mesh``, the dataset shown by the plotter, before ``on_done`` is
+    called.
+
+    Submitting again cancels the previous submission if it has not started
+    yet. Submissions that did start run to completion and their result is
+    shown, unless a newer one was shown already: while a slider is dragged the
+    view keeps following it, one result at a time. The ``filter_busy`` state
+    variable is true while work is in flight.
+
+    Any :mod:`concurrent.futures` executor works. With a process pool, ``func``
+    and its arguments must be picklable.
+    """
+
+    def __init__(self, state, mesh, on_done, executor=None):
+        self.state = state
+        self.mesh = mesh
+        self.on_done = on_done
+        self.executor = executor or ThreadPoolExecutor(max_workers=1)
+        self._latest = None
+        self._submitted = 0
+        self._shown = 0
+        self._in_flight = 0
+        state.filter_busy = False
+
+    def submit(self, func, *args):
+        """Run ``func(*args)`` in the executor and show its result."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop yet, run right away
+            self._show(func(*args))
+            return
+        if self._latest is not None:
+            self._latest.cancel()
+        self._submitted += 1
+        self._latest = self.executor.submit(func, *args)
+        done = functools.partial(self._done, self._submitted)
+        asyncio.wrap_future(self._latest, loop=loop).add_done_callback(done)
+        self._set_in_flight(1)
+
+    def _done(self, sequence, future):
+        self._set_in_flight(-1)
+        if future.cancelled() or sequence < self._shown:
+            return
+        if future.exception() is not None:
+            logger.error("Filter update failed", exc_info=future.exception())
+            return
+        self._shown = sequence
+        self._show(future.result())
+
+    def _show(self, result):
+        self.mesh.shallow_copy(result)
+        self.on_done()
+
+    def _set_in_flight(self, change):
+        self._in_flight += change
+        with self.state:
+            self.state.filter_busy = self._in_flight > 0
+
+
+filters = FilterExecutor(state, warped, on_done=ctrl.view_update)
+
+
+class AdaptiveImageQuality:
+    """
+    Adapt the images of a remote view to the cost of sending them.
+
+    Every image encoded by the server is timed and weighed. While the user
+    interacts with the view, the ``interactive_ratio`` and
+    ``interactive_quality`` state variables are chosen so that encoding and
+    transferring a frame over a link of ``bandwidth`` bytes per second fits in
+    ``1 / fps`` seconds: the image is made smaller first, then its JPEG
+    quality is lowered. Once the interaction stops the view sends one still
+    frame at full size and quality.
+
+    The encode latency and size of the last frames are kept in
+    ``frames`` and summarized in the ``encode_latency`` state variable.
+    """
+
+    def __init__(
+        self,
+        state,
+        fps=30,
+        bandwidth=4 * 2**20,
+        min_ratio=0.25,
+        quality_range=(30, 80),
+    ):
+        self.state = state
+        self.fps = fps
+        self.bandwidth = bandwidth
+        self.min_ratio = min_ratio
+        self.min_quality, self.max_quality = quality_range
+        # (still, encode latency in seconds, image size in bytes) of each frame
+        self.frames = collections.deque(maxlen=240)
+        self._interacting = False
+        self._recent = collections.deque(maxlen=8)
+        state.interactive_ratio = 1
+        state.interactive_quality = self.max_quality
+        state.encode_latency = ""
+
+    def instrument(self, app):
+        """Time the images encoded by ``app``, a ``vtkWebApplication``."""
+        still_render = app.StillRenderToBuffer
+
+        def timed_still_render(view, mtime, quality):
+            start = time.perf_counter()
+            image = still_render(view, mtime, quality)
+            size = image.GetDataSize() if image else 0
+            if size:
+                self.record(time.perf_counter() - start, size)
+            return image
+
+        app.StillRenderToBuffer = timed_still_render
+
+    def record(self, latency, size):
+        """Record a frame and adapt the next ones."""
+        self.frames.append((not self._interacting, latency, size))
+        if self._interacting:
+            self._recent.append(latency + size / self.bandwidth)
+            if len(self._recent) == self._recent.maxlen:
+                self._adapt(statistics.fmean(self._recent))
+                self._recent.clear()
+
+    def _adapt(self, cost):
+        # The cost of a frame grows with its number of pixels
+        scale = 1 / (self.fps * cost)
+        ratio = self.state.interactive_ratio
+        quality = self.state.interactive_quality
+        if scale < 1 and ratio > self.min_ratio:
+            ratio = max(ratio * math.sqrt(scale), self.min_ratio)
+        elif scale < 1:
+            quality = max(round(quality * scale), self.min_quality)
+        elif quality < self.max_quality:
+            quality = min(round(quality * scale), self.max_quality)
+        else:
+            ratio = min(ratio * math.sqrt(scale), 1)
+        with self.state:
+            self.state.interactive_ratio = round(ratio, 2)
+            self.state.interactive_quality = quality
+
+    def start(self, **kwargs):
+        """Start adapting the frames, bound to ``StartInteraction``."""
+        self._interacting = True
+        self._recent.clear()
+
+    def end(self, **kwargs):
+        """Stop adapting the frames, bound to ``EndInteraction``."""
+        self._interacting = False
+        latencies = sorted(1000 * latency for still, latency, _ in self.frames if not still)
+        if not latencies:
+            return
+        sizes = [size for still, _, size in self.frames if not still]
+        p50 = latencies[len(latencies) // 2]
+        p95 = latencies[int(0.95 * (len(latencies) - 1))]
+        with self.state:
+            self.state.encode_latency = (
+                f"{p50:.1f} ms median, {p95:.1f} ms p95, "
+                f"{statistics.fmean(sizes) / 2**10:.0f} KiB per frame"
+            )
+
+
+image_quality = AdaptiveImageQuality(state)
+
+
+@ctrl.add("on_server_ready")
+def instrument_images(**kwargs):
+    image_quality.instrument(server.protocol.getSharedObject("app"))
+
 
 @state.change("scale")
 def update_scale(scale, **kwargs) -> None:
-    warp_by_scalar.SetScaleFactor(scale)
-    ctrl.view_update()
+    filters.submit(warp, scale)
 
 
 with VAppLayout(server, full_height=True) as layout:  # noqa: SIM117
     with v3.VContainer(fluid=True, classes="fill-height"):
-        with vtk_widgets.VtkRemoteView(plotter.render_window, interactive_ratio=1) as view:
+        with vtk_widgets.VtkRemoteView(
+            plotter.render_window,
+            interactive_ratio=("interactive_ratio",),
+            interactive_quality=("interactive_quality",),
+            still_ratio=1,
+            still_quality=98,
+            interactor_events=("interactor_events", ["StartInteraction", "EndInteraction"]),
+            StartInteraction=image_quality.start,
+            EndInteraction=image_quality.end,
+        ) as view:
             ctrl.view_update = view.update
             ctrl.view_reset_camera = view.reset_camera
 
+        # ``trame__busy`` tracks the requests of the client, ``filter_busy``
+        # the filter running on the server
+        v3.VProgressLinear(
+            indeterminate=True,
+            absolute=True,
+            bottom=True,
+            active=("trame__busy || filter_busy",),
+        )
+
         # Event binding
         v3.VBtn(
             icon="mdi-crop-free",
@@ -52,6 +267,13 @@ with VAppLayout(server, full_height=True) as layout:  # noqa: SIM117
             density="compact",
         )
 
+        # Encode latency of the frames sent while interacting
+        v3.VLabel(
+            "{{ encode_latency }}",
+            classes="position-absolute text-caption",
+            style="left: 1rem; bottom: 1rem; z-index: 1",
+        )
+
         # State binding
         v3.VSlider(
             v_model=("scale", 0.3),
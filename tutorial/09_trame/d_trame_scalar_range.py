@@ -5,6 +5,11 @@ Control Scalar Range
 Extending our simple example to control the color limits of the mapped scalars.
 """
 
+import asyncio
+import functools
+import math
+import time
+
 import pyvista as pv
 from pyvista.trame.ui import plotter_ui
 from trame.app import get_server
@@ -16,6 +21,45 @@ pv.OFF_SCREEN = True
 server = get_server()
 state, ctrl = server.state, server.controller
 
+
+class CoalescingDispatcher:
+    """
+    Coalesce bursts of state changes into one call per frame interval.
+
+    Dragging a slider changes the state dozens of times per second. Only the
+    latest values are kept and the callback runs at most once every
+    ``interval`` seconds, so stale updates are dropped instead of queuing
+    renders.
+    """
+
+    def __init__(self, callback, interval=1 / 30):
+        functools.update_wrapper(self, callback)
+        self.callback = callback
+        self.interval = interval
+        self._kwargs = None
+        self._handle = None
+        self._last = -math.inf
+
+    def __call__(self, **kwargs):
+        self._kwargs = kwargs
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop yet, run right away
+            self._flush()
+            return
+        if self._handle is None:
+            delay = max(self._last + self.interval - time.monotonic(), 0)
+            self._handle = loop.call_later(delay, self._flush)
+
+    def _flush(self):
+        self._handle = None
+        kwargs, self._kwargs = self._kwargs, None
+        if kwargs is not None:
+            self._last = time.monotonic()
+            self.callback(**kwargs)
+
+
 mesh = pv.Wavelet()
 
 pl = pv.Plotter()
@@ -23,6 +67,7 @@ actor = pl.add_mesh(mesh)
 
 
 @state.change("scalar_range")
+@CoalescingDispatcher
 def set_scalar_range(scalar_range=mesh.get_data_range(), **kwargs) -> None:  # noqa: B008
     actor.mapper.scalar_range = scalar_range
     ctrl.view_update()
@@ -4,6 +4,10 @@ Using VTK, PyVista, and Trame
 
 This example demonstrates how to use VTK, PyVista, and Trame together
 to show how the three libraries complement each other.
+
+The cone source is fast enough to update right in the state callback. Slower
+filters can be run on a worker thread with the ``FilterExecutor`` of
+``b_trame_vtk.py``, so that the application stays responsive while they update.
 """
 
 import pyvista as pv
@@ -4,17 +4,24 @@ Open Mesh File
 
 An example of opening a mesh file from the browser and viewing it with PyVista.
 
+The uploaded bytes are parsed in memory: VTP, VTU and PLY files are handed to
+the VTK readers as an input string and binary STL files are decoded with
+NumPy, so the mesh is never written to and read back from a temporary file.
+
 """
 
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pyvista as pv
 from pyvista.trame.ui import plotter_ui
 from trame.app import get_server
 from trame.app.file_upload import ClientFile
 from trame.ui.vuetify3 import SinglePageLayout
 from trame.widgets import vuetify3
+from vtkmodules.vtkIOPLY import vtkPLYReader
+from vtkmodules.vtkIOXML import vtkXMLPolyDataReader, vtkXMLUnstructuredGridReader
 
 pv.OFF_SCREEN = True
 
@@ -23,6 +30,56 @@ state, ctrl = server.state, server.controller
 
 pl = pv.Plotter()
 
+# Readers able to parse a file from memory
+STRING_READERS = {
+    ".ply": vtkPLYReader,
+    ".vtp": vtkXMLPolyDataReader,
+    ".vtu": vtkXMLUnstructuredGridReader,
+}
+
+# A binary STL file is an 80 bytes header, a triangle count and the triangles
+STL_HEADER_SIZE = 84
+STL_TRIANGLE = np.dtype([("normal", "<f4", 3), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")])
+
+
+def stl_triangle_count(content):
+    return int(np.frombuffer(content, dtype="<u4", count=1, offset=STL_HEADER_SIZE - 4)[0])
+
+
+def is_binary_stl(content):
+    if len(content) < STL_HEADER_SIZE:
+        return False
+    return len(content) == STL_HEADER_SIZE + stl_triangle_count(content) * STL_TRIANGLE.itemsize
+
+
+def read_binary_stl(content):
+    """Read a binary STL file straight from its bytes."""
+    triangles = np.frombuffer(
+        content, dtype=STL_TRIANGLE, count=stl_triangle_count(content), offset=STL_HEADER_SIZE
+    )
+    points = triangles["vertices"].reshape(-1, 3)
+    faces = np.arange(len(points)).reshape(-1, 3)
+    # Every triangle has its own copy of its vertices, merge them
+    return pv.PolyData.from_regular_faces(points, faces).clean()
+
+
+def read_content(name, content):
+    """Read a mesh from the content of an uploaded file."""
+    suffix = Path(name).suffix.lower()
+    if suffix == ".stl" and is_binary_stl(content):
+        return read_binary_stl(content)
+    if suffix in STRING_READERS:
+        reader = STRING_READERS[suffix]()
+        reader.ReadFromInputStringOn()
+        reader.SetInputString(content)
+        reader.Update()
+        return pv.wrap(reader.GetOutput())
+    # Other formats, including ASCII STL, are read from a temporary file
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / Path(name).name
+        path.write_bytes(content)
+        return pv.read(path)
+
 
 @server.state.change("file_exchange")
 def handle(file_exchange, **kwargs) -> None:
@@ -30,11 +87,7 @@ def handle(file_exchange, **kwargs) -> None:
 
     if file.content:
         print(file.info)  # noqa: T201
-        bytes = file.content  # noqa: A001
-        with tempfile.NamedTemporaryFile(suffix=file.name) as path:
-            with Path(path.name).open("wb") as f:
-                f.write(bytes)
-            ds = pv.read(path.name)
+        ds = read_content(file.name, file.content)
         pl.add_mesh(ds, name=file.name)
         pl.reset_camera()
     else:
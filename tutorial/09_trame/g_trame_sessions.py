@@ -0,0 +1,206 @@
+"""
+Serve Many Sessions
+~~~~~~~~~~~~~~~~~~~
+
+Host independent sessions of an application in one process while loading
+every dataset only once.
+
+Each of the previous applications calls ``get_server()`` and loads its mesh in
+its own process, so serving a class of 50 users means 50 copies of the same
+data. Here every session gets its own server, state and plotter, but the
+datasets come from a cache shared by all the sessions of the process: the
+memory grows with the number of distinct datasets rather than with the number
+of users.
+"""
+
+import collections
+import threading
+
+import numpy as np
+import pyvista as pv
+from pyvista import examples
+from pyvista.trame.ui import plotter_ui
+from trame.app import get_server
+from trame.ui.vuetify3 import SinglePageLayout
+from trame.widgets import vuetify3
+
+pv.OFF_SCREEN = True
+
+# %%
+# The dataset cache
+# +++++++++++++++++
+# ``acquire`` returns a shallow copy of the cached dataset: the arrays are
+# shared, while the active scalars and the other attributes belong to the
+# session. Sessions must therefore never modify the values of the arrays
+# in-place. A dataset is dropped once the last session using it released it.
+
+
+class DatasetCache:
+    """Share read-only datasets between sessions."""
+
+    def __init__(self, loaders):
+        self.loaders = loaders
+        self._datasets = {}
+        self._references = collections.Counter()
+        self._lock = threading.Lock()
+
+    def acquire(self, name):
+        """Return a shallow copy of the dataset ``name``, loading it if needed."""
+        with self._lock:
+            if name not in self._datasets:
+                self._datasets[name] = self.loaders[name]()
+            self._references[name] += 1
+            return self._datasets[name].copy(deep=False)
+
+    def release(self, name):
+        """Release a dataset returned by ``acquire``."""
+        with self._lock:
+            self._references[name] -= 1
+            if not self._references[name]:
+                del self._references[name]
+                del self._datasets[name]
+
+    @property
+    def references(self):
+        """Return the number of sessions using each loaded dataset."""
+        with self._lock:
+            return dict(self._references)
+
+
+cache = DatasetCache(
+    {
+        "antarctica": examples.download_antarctica_velocity,
+        "hills": examples.load_random_hills,
+    }
+)
+
+# %%
+# The sessions
+# ++++++++++++
+# A ``Session`` is the scalar selection application of ``c_trame_scalars.py``
+# with its own named server, so that its state is not shared with the other
+# sessions. When the server of a session stops, its datasets are released.
+
+
+class Session:
+    """An application with its own server, state and plotter."""
+
+    _count = 0
+
+    def __init__(self, cache, dataset):
+        Session._count += 1
+        self.number = Session._count
+        self.server = get_server(f"session_{self.number}")
+        self.cache = cache
+        self.dataset = dataset
+        self.mesh = cache.acquire(dataset)
+        self.plotter = pv.Plotter()
+        self.actor = self.plotter.add_mesh(self.mesh)
+        self.plotter.view_xy()
+
+        state, ctrl = self.server.state, self.server.controller
+        state.change("scalars")(self.set_scalars)
+        state.change("log_scale")(self.set_log_scale)
+        ctrl.on_server_exited.add(self.close)
+        self.ui = self._build_ui()
+
+    def set_scalars(self, scalars, **kwargs):
+        self.actor.mapper.array_name = scalars
+        self.actor.mapper.scalar_range = self.mesh.get_data_range(scalars)
+        self.server.controller.view_update()
+
+    def set_log_scale(self, log_scale, **kwargs):
+        self.actor.mapper.lookup_table.log_scale = log_scale
+        self.server.controller.view_update()
+
+    def _build_ui(self):
+        with SinglePageLayout(self.server) as layout:
+            layout.title.set_text(f"Session {self.number}: {self.dataset}")
+            with layout.toolbar:
+                vuetify3.VSpacer()
+                vuetify3.VCheckbox(
+                    label="Log Scale",
+                    v_model=("log_scale", False),
+                    hide_details=True,
+                    density="compact",
+                    outlined=True,
+                )
+                vuetify3.VSelect(
+                    label="Scalars",
+                    v_model=("scalars", self.mesh.active_scalars_name),
+                    items=("array_list", list(self.mesh.point_data.keys())),
+                    hide_details=True,
+                    density="compact",
+                    outlined=True,
+                    classes="pt-1 ml-2",
+                    style="max-width: 250px",
+                )
+
+            with (
+                layout.content,
+                vuetify3.VContainer(fluid=True, classes="pa-0 fill-height"),
+            ):
+                view = plotter_ui(self.plotter)
+                self.server.controller.view_update = view.update
+        return layout
+
+    def close(self, **kwargs):
+        """Free the plotter and release the dataset of the session."""
+        if self.mesh is not None:
+            self.plotter.close()
+            self.cache.release(self.dataset)
+            self.mesh = None
+
+
+# %%
+# Two users looking at the same dataset share its arrays. Changing the
+# scalars of one session does not affect the other one.
+
+first = Session(cache, "antarctica")
+second = Session(cache, "antarctica")
+np.shares_memory(first.mesh.points, second.mesh.points)
+
+# %%
+# Only one copy of the dataset is loaded, used by two sessions.
+
+cache.references
+
+# %%
+
+await first.ui.ready
+first.ui
+
+# %%
+
+await second.ui.ready
+second.ui
+
+# %%
+# Serving a class
+# +++++++++++++++
+# Outside of Jupyter, sessions are started as tasks on the event loop of the
+# process, each listening on its own port. With a ``timeout``, the server of a
+# session stops ``timeout`` seconds after its user left, which releases its
+# data.
+#
+# .. code:: python
+#
+#     async def serve(n_users, dataset="antarctica"):
+#         sessions = [Session(cache, dataset) for _ in range(n_users)]
+#         await asyncio.gather(
+#             *(
+#                 session.server.start(port=0, exec_mode="coroutine", timeout=30)
+#                 for session in sessions
+#             )
+#         )
+#
+#
+#     asyncio.run(serve(50))
+#
+# .. raw:: html
+#
+#     <center>
+#       <a target="_blank" href="https://colab.research.google.com/github/pyvista/pyvista-tutorial/blob/tutorial/notebooks/09_trame/g_trame_sessions.ipynb">
+#         <img src="https://colab.research.google.com/assets/colab-badge.svg" alt="Open In Colab"/ width="150px">
+#       </a>
+#     </center>